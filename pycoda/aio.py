@@ -0,0 +1,54 @@
+"""Loading CODA files from asyncio byte streams, without blocking the event loop"""
+
+from __future__ import unicode_literals
+
+import asyncio
+
+from pycoda.codafile import CodaFile
+from pycoda.records import DEFAULT_ENCODING
+
+CHUNK_SIZE = 1 << 16
+
+
+def _load_lines(lines, encoding):
+    """Records for a batch of complete lines, run in the executor"""
+    coda_file = CodaFile()
+    return [coda_file._load_record(line.rstrip(b"\r"), encoding) for line in lines]
+
+
+async def aiterload(
+    stream, encoding=DEFAULT_ENCODING, chunk_size=CHUNK_SIZE, executor=None
+):
+    """Asynchronously generates the records read from an async byte stream
+
+    `stream` is any object with an awaitable `read(size)` returning bytes, such
+    as an `asyncio.StreamReader`. It is read `chunk_size` bytes at a time and the
+    complete lines of each chunk are parsed in `executor` (by default, the event
+    loop's default executor), so control returns to the event loop between chunks.
+    """
+    loop = asyncio.get_running_loop()
+    remainder = b""
+    while True:
+        chunk = await stream.read(chunk_size)
+        if not chunk:
+            break
+        lines = (remainder + chunk).split(b"\n")
+        # The last line may continue in the next chunk
+        remainder = lines.pop()
+        if lines:
+            records = await loop.run_in_executor(executor, _load_lines, lines, encoding)
+            for record in records:
+                yield record
+    if remainder.rstrip(b"\r"):
+        for record in _load_lines([remainder], encoding):
+            yield record
+
+
+async def aload(
+    stream, encoding=DEFAULT_ENCODING, chunk_size=CHUNK_SIZE, executor=None
+):
+    """Load a whole CodaFile from an async byte stream, see :func:`aiterload`"""
+    records = aiterload(
+        stream, encoding=encoding, chunk_size=chunk_size, executor=executor
+    )
+    return CodaFile([record async for record in records])
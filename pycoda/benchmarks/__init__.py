@@ -0,0 +1,14 @@
+"""Benchmarks of loading and dumping generated CODA corpora
+
+Run ``python -m pycoda.benchmarks --output results.json`` to time the loads and
+dumps of `CodaFile`, of each record type and of each field type, and to measure
+the peak memory of loading and dumping a whole corpus. The results are written as
+JSON, to compare runs across versions.
+"""
+
+from __future__ import unicode_literals
+
+from pycoda.benchmarks.corpus import corpus
+from pycoda.benchmarks.runner import main, run
+
+__all__ = ("corpus", "main", "run")
@@ -0,0 +1,5 @@
+from __future__ import unicode_literals
+
+from pycoda.benchmarks.runner import main
+
+main()
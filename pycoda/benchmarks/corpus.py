@@ -0,0 +1,90 @@
+"""Generated CODA corpora to benchmark on"""
+
+from __future__ import unicode_literals
+
+from decimal import Decimal
+
+from factory import random
+
+from pycoda.codafile import CodaFile
+from pycoda.factories import (
+    FinalRecordFactory,
+    InformationRecordFactory,
+    InitialRecordFactory,
+    NewBalanceRecordFactory,
+    OldBalanceRecordFactory,
+    TransactionDetailRecordFactory,
+    TransactionPurposeRecordFactory,
+    TransactionRecordFactory,
+)
+from pycoda.fields import BalanceField
+from pycoda.validation import signed
+
+STATEMENTS = 10
+MOVEMENTS = 100
+SEED = 0
+
+
+def statement_records(movements=MOVEMENTS):
+    """Records of a single statement, with a transaction, purpose, detail and
+    information record for each of its global movements, sharing its serial number
+    and detail number 0
+
+    The statement reconciles: its new balance is the old balance plus the signed
+    amounts of its movements, and its final record holds their debit and credit.
+    """
+    old_balance = OldBalanceRecordFactory(direct_debit=True)
+    records = [InitialRecordFactory(direct_debit=True), old_balance]
+    balance = signed(old_balance.old_balance, old_balance.balance_sign)
+    totals = {0: Decimal(0), BalanceField.DEBIT: Decimal(0)}
+    for serial_number in range(1, movements + 1):
+        transaction = TransactionRecordFactory(
+            direct_debit=True,
+            serial_number=serial_number,
+            detail_number=0,
+            balance=Decimal(serial_number * 10).scaleb(-3),
+        )
+        totals[transaction.balance_sign] += transaction.balance
+        balance += signed(transaction.balance, transaction.balance_sign)
+        records.extend(
+            (
+                transaction,
+                TransactionPurposeRecordFactory(
+                    direct_debit=True, serial_number=serial_number, detail_number=0
+                ),
+                TransactionDetailRecordFactory(
+                    direct_debit=True, serial_number=serial_number, detail_number=0
+                ),
+                InformationRecordFactory(
+                    direct_debit=True, serial_number=serial_number, detail_number=0
+                ),
+            )
+        )
+    records.extend(
+        (
+            NewBalanceRecordFactory(
+                new_balance=abs(balance),
+                balance_sign=BalanceField.DEBIT if balance < 0 else 0,
+            ),
+            FinalRecordFactory(
+                direct_debit=True,
+                number_records=4 * movements + 2,
+                debit=totals[BalanceField.DEBIT],
+                credit=totals[0],
+            ),
+        )
+    )
+    return records
+
+
+def corpus(statements=STATEMENTS, movements=MOVEMENTS, seed=SEED):
+    """CodaFile of `statements` generated statements of `movements` movements
+
+    The factories are seeded with `seed`, so the same arguments give the same
+    corpus from one run to the next.
+    """
+    random.reseed_random(seed)
+    records = []
+    for _ in range(statements):
+        records.extend(statement_records(movements))
+    return CodaFile(records)
@@ -0,0 +1,123 @@
+"""Timings and peak memory of loading and dumping a generated corpus"""
+
+from __future__ import unicode_literals
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+from copy import copy
+
+import pycoda
+from pycoda.benchmarks.corpus import MOVEMENTS, SEED, STATEMENTS, corpus
+from pycoda.codafile import CodaFile
+
+NUMBER = 10
+REPEAT = 3
+
+
+def measure(function, number=NUMBER, repeat=REPEAT):
+    """Best and mean time in seconds of a single call, over `repeat` runs of
+    `number` calls"""
+    runs = [
+        run / number for run in timeit.repeat(function, number=number, repeat=repeat)
+    ]
+    return {"best": min(runs), "mean": sum(runs) / len(runs), "number": number}
+
+
+def peak_memory(function):
+    """Peak memory in bytes allocated while calling a function"""
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _record_samples(coda_file):
+    """A loaded line and a dumpable record of each record type in the corpus"""
+    samples = {}
+    for record in coda_file.records:
+        samples.setdefault(type(record), (record.dumps(), record))
+    return samples
+
+
+def _field_samples(samples):
+    """A standalone field and a string to load of each field type in the corpus"""
+    fields = {}
+    for line, record in samples.values():
+        for field in record._fields:
+            string = line[field.position : field.position + field.length]
+            # Copied, as loading would otherwise change the layout of the record class
+            fields.setdefault(type(field), (copy(field), string))
+    return fields
+
+
+def run(statements=STATEMENTS, movements=MOVEMENTS, number=NUMBER, repeat=REPEAT):
+    """Benchmark results of a corpus of the given size, as a JSON-ready dict"""
+    coda_file = corpus(statements=statements, movements=movements, seed=SEED)
+    string = coda_file.dumps()
+    timings = {}
+
+    def time(name, function):
+        timings[name] = measure(function, number=number, repeat=repeat)
+
+    time("CodaFile.loads", lambda: CodaFile().loads(string))
+    time("CodaFile.loads lazy", lambda: CodaFile(lazy=True).loads(string))
+    time("CodaFile.dumps", coda_file.dumps)
+    loaded = CodaFile()
+    loaded.loads(string)
+    time("CodaFile.dumps loaded", loaded.dumps)
+
+    samples = _record_samples(coda_file)
+    for record_type, (line, record) in samples.items():
+        name = record_type.__name__
+        time(name + ".loads", lambda: record_type().loads(line))
+        time(name + ".dumps", record.dumps)
+    for field_type, (field, field_string) in _field_samples(samples).items():
+        name = field_type.__name__
+        time(name + ".loads", lambda: field.loads(field_string))
+        time(name + ".dumps", field.dumps)
+
+    memory = {
+        "CodaFile.loads": peak_memory(lambda: CodaFile().loads(string)),
+        "CodaFile.loads lazy": peak_memory(lambda: CodaFile(lazy=True).loads(string)),
+        "CodaFile.dumps": peak_memory(coda_file.dumps),
+    }
+    return {
+        "version": pycoda.__version__,
+        "python": platform.python_version(),
+        "corpus": {
+            "statements": statements,
+            "movements": movements,
+            "lines": len(coda_file.records),
+            "bytes": len(string),
+        },
+        "timings": timings,
+        "memory": memory,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m pycoda.benchmarks", description=__doc__
+    )
+    parser.add_argument("--statements", type=int, default=STATEMENTS)
+    parser.add_argument("--movements", type=int, default=MOVEMENTS)
+    parser.add_argument("--number", type=int, default=NUMBER)
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument(
+        "--output", type=argparse.FileType("w"), default=sys.stdout, help="JSON file"
+    )
+    arguments = parser.parse_args(argv)
+    results = run(
+        statements=arguments.statements,
+        movements=arguments.movements,
+        number=arguments.number,
+        repeat=arguments.repeat,
+    )
+    json.dump(results, arguments.output, indent=2, sort_keys=True)
+    arguments.output.write("\n")
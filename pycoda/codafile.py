@@ -1,8 +1,11 @@
 from __future__ import unicode_literals
 
-from os import linesep
+import mmap
+import os
+from os import PathLike, linesep
 
 from pycoda.records import (
+    DEFAULT_ENCODING,
     ExtraMessageRecord,
     FinalRecord,
     InformationDetailRecord,
@@ -16,6 +19,8 @@ from pycoda.records import (
     TransactionPurposeRecord,
     TransactionRecord,
 )
+from pycoda.statement import iterstatements
+from pycoda.writer import CodaWriter
 
 RECORD_TYPES = (
     InitialRecord,
@@ -37,29 +42,187 @@ for record_type in RECORD_TYPES:
 
 
 class CodaFile(object):
-    def __init__(self, records=None):
+    def __init__(
+        self,
+        records=None,
+        lazy=False,
+        instrumentation=None,
+        milli_units=False,
+        intern=False,
+    ):
+        """With `lazy`, the fields of loaded records are decoded on first access
+
+        An `Instrumentation` counts and times the loading and dumping of records.
+        With `milli_units`, amounts are loaded as signed integer milli-units, see
+        `Record.loads`.
+
+        With `intern`, repeated values of the low-cardinality string fields, such
+        as account numbers and BICs, share a single string across all records
+        loaded by this file, through the table in `interned`. Pass a dict instead
+        to share the table between files.
+        """
         self.records = records or []
+        self.lazy = lazy
+        self.instrumentation = instrumentation
+        self.milli_units = milli_units
+        if isinstance(intern, dict):
+            self.interned = intern
+        else:
+            self.interned = {} if intern else None
 
     def _record_from_header(self, line):
         """Builds record from type, read from first 2 entries on the line"""
-        record_id = int(line[0])
+        record_id = int(line[0:1])
         if record_id in (
             RecordIdentification.TRANSACTION,
             RecordIdentification.INFORMATION,
         ):
-            article_id = int(line[1])
+            article_id = int(line[1:2])
         else:
             article_id = None
         return record_map.get((record_id, article_id))()
 
-    def loads(self, string, append=False):
+    def _load_record(self, line, encoding=DEFAULT_ENCODING):
+        """Builds record from its header and loads the full line into it"""
+        if self.instrumentation is not None:
+            return self.instrumentation.load_record(self, line, encoding)
+        record = self._record_from_header(line)
+        record.loads(
+            line,
+            encoding=encoding,
+            lazy=self.lazy,
+            milli_units=self.milli_units,
+            interned=self.interned,
+        )
+        return record
+
+    def loads(self, string, append=False, encoding=DEFAULT_ENCODING):
         # By default, do not append for a new load
         if not append:
             self.records = []
+        # Bytes are parsed as is, only text fields get decoded with the encoding
         for line in string.splitlines():
-            record = self._record_from_header(line)
-            record.loads(line)
-            self.records.append(record)
+            self.records.append(self._load_record(line, encoding))
+
+    def load(self, source, append=False, encoding=DEFAULT_ENCODING, processes=1):
+        """Loads the records from a path or a text / binary file object
+
+        With more than one of `processes` (None for one per CPU core), the file at
+        the given path is cut at line boundaries into byte ranges, which are parsed
+        on separate worker processes and stitched back together in order. This
+        needs a path, file objects raise a ValueError. The workers load lazily or
+        in milli-units as this file does; an intern table or an instrumentation
+        cannot be shared with them and raises a ValueError.
+        """
+        if processes != 1 and not isinstance(source, (str, PathLike)):
+            raise ValueError("Loading with processes needs a path, not a file object")
+        if processes != 1 and (
+            self.interned is not None or self.instrumentation is not None
+        ):
+            raise ValueError(
+                "Intern tables and instrumentation cannot be used with processes"
+            )
+        # By default, do not append for a new load
+        if not append:
+            self.records = []
+        if processes == 1:
+            self.records.extend(self.iterload(source, encoding=encoding))
+            return
+        # Imported here, as the parallel module itself builds on this one
+        from pycoda.parallel import parse_ranges
+
+        self.records.extend(
+            parse_ranges(
+                source,
+                processes=processes,
+                encoding=encoding,
+                lazy=self.lazy,
+                milli_units=self.milli_units,
+            )
+        )
+
+    def iterload(self, source, encoding=DEFAULT_ENCODING, use_mmap=False):
+        """Generates records line by line from a path or a text / binary file object
+
+        Paths are opened in binary mode. Binary lines are parsed as bytes and only
+        their text fields are decoded, with `encoding`. The records are not kept in
+        `self.records`, so memory use does not grow with the file size. With
+        `use_mmap`, a path is memory-mapped instead of read and records load
+        straight from slices of the mapped buffer. Unless lazy, these records do not
+        keep their line, see `Record.loads`.
+        """
+        if isinstance(source, (str, PathLike)):
+            if use_mmap:
+                yield from self._iterload_mmap(source, encoding)
+                return
+            with open(source, "rb") as fp:
+                yield from self.iterload(fp, encoding=encoding)
+            return
+        for line in source:
+            terminator = b"\r\n" if isinstance(line, bytes) else "\r\n"
+            yield self._load_record(line.rstrip(terminator), encoding)
 
     def dumps(self, sep=linesep):
+        if self.instrumentation is not None:
+            dumps = self.instrumentation.dumps
+            return sep.join(dumps(record) for record in self.records)
         return sep.join(record.dumps() for record in self.records)
+
+    def dump(self, target, records=None, sep=linesep, encoding=DEFAULT_ENCODING):
+        """Writes the records to a path or a text / binary file object
+
+        The output is the same as `dumps`, streamed in batches by a `CodaWriter`.
+        `records` can be any iterable, such as a record generator, and defaults to
+        the loaded records. Paths are opened in binary mode.
+        """
+        if records is None:
+            records = self.records
+        if isinstance(target, (str, PathLike)):
+            with open(target, "wb") as fp:
+                self.dump(fp, records=records, sep=sep, encoding=encoding)
+            return
+        with CodaWriter(
+            target, sep=sep, encoding=encoding, instrumentation=self.instrumentation
+        ) as writer:
+            writer.writerecords(records)
+
+    def iterstatements(self, source=None, encoding=DEFAULT_ENCODING, use_mmap=False):
+        """Generates the statements of a path or file object, as they are read
+
+        Each statement is generated as soon as its final record has been read,
+        see `iterload` for the arguments. Without `source`, the statements of the
+        loaded records are generated instead.
+        """
+        if source is None:
+            return iterstatements(self.records)
+        records = self.iterload(source, encoding=encoding, use_mmap=use_mmap)
+        return iterstatements(records)
+
+    def _iterload_mmap(self, path, encoding):
+        """Generates records from zero-copy memoryview slices of a mapped file"""
+        with open(path, "rb") as fp:
+            if os.fstat(fp.fileno()).st_size == 0:
+                return
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                with memoryview(buffer) as view:
+                    for start, end in _line_spans(buffer):
+                        # Released right away, even on errors, for the map to close
+                        with view[start:end] as line:
+                            record = self._load_record(line, encoding)
+                        yield record
+
+
+def _line_spans(buffer):
+    """Start and end offsets of each line in a buffer, without line terminator"""
+    start, size = 0, len(buffer)
+    find = buffer.find
+    while start < size:
+        end = find(b"\n", start)
+        if end == -1:
+            end = size
+        next_start = end + 1
+        # Indexing gives an int, comparing it does not copy a slice
+        if end > start and buffer[end - 1] == 13:
+            end -= 1
+        yield start, end
+        start = next_start
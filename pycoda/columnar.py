@@ -0,0 +1,231 @@
+"""Columnar parsing of whole CODA files into NumPy structured arrays
+
+This module needs the optional `numpy` dependency. Instead of building a record
+object per line, a file is viewed as an N x 128 matrix of bytes, which is split on
+the record type columns and decoded column by column:
+
+  * NumericField: int64
+  * DateField: datetime64[D]
+  * BalanceField: int64, in thousandths (the field's implied decimal places)
+  * BooleanField: bool
+  * StringField: fixed-width bytes, left undecoded
+
+Empty and zeroes fields hold no data and are left out. Each array starts with a
+`line` column, the index of the row's line in the file.
+"""
+
+from __future__ import unicode_literals
+
+from os import PathLike
+
+import numpy as np
+
+from pycoda.codafile import RECORD_TYPES
+from pycoda.fields import (
+    BalanceField,
+    BooleanField,
+    DateField,
+    EmptyField,
+    NumericField,
+    ZeroesField,
+    _amount,
+)
+from pycoda.records import (
+    DEFAULT_ENCODING,
+    FinalRecord,
+    NewBalanceRecord,
+    OldBalanceRecord,
+    RecordIdentification,
+    TransactionRecord,
+)
+from pycoda.validation import COUNTED_IDENTIFICATIONS, Discrepancy
+
+LINE_LENGTH = 128
+
+_ZERO = ord("0")
+_NINE = ord("9")
+_SPACE = ord(" ")
+
+
+def _columns(record_type):
+    """Name and field of each data field of a record type, in layout order"""
+    for name, field in record_type._columns:
+        if not isinstance(field, (EmptyField, ZeroesField)):
+            yield name, field
+
+
+def _numeric(chars):
+    """Integer value of each row of digit characters, skipping spaces like int()"""
+    is_digit = (chars >= _ZERO) & (chars <= _NINE)
+    if not np.all(is_digit | (chars == _SPACE)):
+        raise ValueError("Numeric column holds characters other than digits")
+    values = np.zeros(len(chars), dtype=np.int64)
+    digits = chars.astype(np.int64) - _ZERO
+    for index in range(chars.shape[1]):
+        values = np.where(is_digit[:, index], values * 10 + digits[:, index], values)
+    return values
+
+
+def _date(chars, field):
+    """Dates of each row of characters, vectorised for the default format"""
+    if field.date_format != "%d%m%y":
+        strings = np.ascontiguousarray(chars).view("S{}".format(chars.shape[1]))
+        values = [field._cast(string.decode("ascii")) for string in strings.ravel()]
+        return np.array(values, dtype="datetime64[D]")
+    day = _numeric(chars[:, 0:2])
+    month = _numeric(chars[:, 2:4])
+    year = _numeric(chars[:, 4:6])
+    # Same pivot as strptime's %y: 69-99 map to the 1900s, 00-68 to the 2000s
+    year = np.where(year < 69, year + 2000, year + 1900)
+    months = (year - 1970) * 12 + month - 1
+    dates = months.astype("datetime64[M]").astype("datetime64[D]")
+    dates = dates + (day - 1).astype("timedelta64[D]")
+    valid = (month >= 1) & (month <= 12) & (day >= 1)
+    valid &= dates.astype("datetime64[M]") == months.astype("datetime64[M]")
+    if not np.all(valid):
+        raise ValueError("Date column holds invalid dates")
+    return dates
+
+
+def _decode(chars, field):
+    """Decoded column and its dtype for a field"""
+    if isinstance(field, NumericField):
+        start = len(field.head)
+        stop = field.length - len(field.tail)
+        return _numeric(chars[:, start:stop]), np.int64
+    if isinstance(field, DateField):
+        return _date(chars, field), "datetime64[D]"
+    if isinstance(field, BalanceField):
+        return _numeric(chars), np.int64
+    if isinstance(field, BooleanField):
+        true_value = np.frombuffer(field.true_value.encode("ascii"), dtype=np.uint8)
+        return np.all(chars == true_value, axis=1), np.bool_
+    dtype = "S{}".format(field.length)
+    return np.ascontiguousarray(chars).view(dtype).ravel(), dtype
+
+
+def _structured(record_type, rows, lines):
+    """Structured array with one decoded column per data field of a record type"""
+    columns = [("line", np.int64, lines)]
+    for name, field in _columns(record_type):
+        chars = rows[:, field.position : field.position + field.length]
+        values, dtype = _decode(chars, field)
+        columns.append((name, dtype, values))
+    array = np.empty(len(rows), dtype=[(name, dtype) for name, dtype, _ in columns])
+    for name, _, values in columns:
+        array[name] = values
+    return array
+
+
+def _line_matrix(data):
+    """View the bytes of a file as an N x 128 matrix, one row per line"""
+    end = data.find(b"\n")
+    terminator = b"\r\n" if end > 0 and data[end - 1 : end] == b"\r" else b"\n"
+    if data and not data.endswith(terminator):
+        data += terminator
+    stride = LINE_LENGTH + len(terminator)
+    if len(data) % stride != 0:
+        raise ValueError("Lines are not all {} characters long".format(LINE_LENGTH))
+    rows = np.frombuffer(data, dtype=np.uint8).reshape(-1, stride)
+    if not np.all(rows[:, LINE_LENGTH:] == np.frombuffer(terminator, np.uint8)):
+        raise ValueError("Lines are not all {} characters long".format(LINE_LENGTH))
+    return rows[:, :LINE_LENGTH]
+
+
+def loads(data, encoding=DEFAULT_ENCODING):
+    """Parse CODA content into a structured array per record type
+
+    `data` is bytes, or a string which is first encoded with `encoding`. Returns a
+    dict mapping each record type to the array of its lines, in file order.
+    """
+    if isinstance(data, str):
+        data = data.encode(encoding)
+    rows = _line_matrix(bytes(data))
+    # Same key as the record map: the identification, plus the article for
+    # transaction and information records
+    identification = rows[:, 0].astype(np.int64) - _ZERO
+    article = rows[:, 1].astype(np.int64) - _ZERO
+    has_article = np.isin(
+        identification,
+        (RecordIdentification.TRANSACTION, RecordIdentification.INFORMATION),
+    )
+    known = np.zeros(len(rows), dtype=np.bool_)
+    arrays = {}
+    for record_type in RECORD_TYPES:
+        mask = identification == record_type.IDENTIFICATION
+        if record_type.ARTICLE is None:
+            mask &= ~has_article
+        else:
+            mask &= article == record_type.ARTICLE
+        known |= mask
+        arrays[record_type] = _structured(record_type, rows[mask], np.flatnonzero(mask))
+    if not np.all(known):
+        raise ValueError("Unknown record type on line {}".format(np.argmin(known) + 1))
+    return arrays
+
+
+def load(source, encoding=DEFAULT_ENCODING):
+    """Parse a CODA file, from a path or binary file object, see :func:`loads`"""
+    if isinstance(source, (str, PathLike)):
+        with open(source, "rb") as fp:
+            return loads(fp.read(), encoding=encoding)
+    return loads(source.read(), encoding=encoding)
+
+
+def _signed(amounts, signs):
+    return np.where(signs == BalanceField.DEBIT, -amounts, amounts)
+
+
+def verify(arrays):
+    """Vectorised :func:`pycoda.validation.verify`, over the arrays of :func:`loads`
+
+    The rows of every record type are assigned to their statement, which ends at
+    a final record, and totalled per statement in a few array operations, so a
+    whole archive is checked at once.
+    """
+    final_lines = arrays[FinalRecord]["line"]
+    count = len(final_lines)
+
+    def totals(array, values):
+        # Rows after the last final record are collected in an extra bin, dropped
+        result = np.zeros(count + 1, dtype=np.int64)
+        np.add.at(result, np.searchsorted(final_lines, array["line"]), values)
+        return result[:count]
+
+    old = arrays[OldBalanceRecord]
+    balance = totals(old, _signed(old["old_balance"], old["balance_sign"]))
+    transactions = arrays[TransactionRecord]
+    transactions = transactions[transactions["detail_number"] == 0]
+    is_debit = transactions["balance_sign"] == BalanceField.DEBIT
+    debit = totals(transactions, np.where(is_debit, transactions["balance"], 0))
+    credit = totals(transactions, np.where(is_debit, 0, transactions["balance"]))
+    balance += credit - debit
+    new = arrays[NewBalanceRecord]
+    new_balance = totals(new, _signed(new["new_balance"], new["balance_sign"]))
+    has_new_balance = totals(new, 1) > 0
+    number_records = sum(
+        totals(array, 1)
+        for record_type, array in arrays.items()
+        if record_type.IDENTIFICATION in COUNTED_IDENTIFICATIONS
+    )
+    finals = arrays[FinalRecord]
+
+    discrepancies = []
+    for name, expected, actual, convert, checked in (
+        ("new_balance", new_balance, balance, _amount, has_new_balance),
+        ("debit", finals["debit"], debit, _amount, True),
+        ("credit", finals["credit"], credit, _amount, True),
+        ("number_records", finals["number_records"], number_records, int, True),
+    ):
+        for statement in np.flatnonzero((expected != actual) & checked):
+            discrepancies.append(
+                Discrepancy(
+                    int(statement),
+                    name,
+                    convert(expected[statement]),
+                    convert(actual[statement]),
+                )
+            )
+    # Same order as the streaming verification: by statement, then by check
+    discrepancies.sort(key=lambda discrepancy: discrepancy.statement)
+    return discrepancies
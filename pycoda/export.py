@@ -0,0 +1,148 @@
+"""Streaming export of records and movements to CSV and JSON Lines
+
+Records are written one row or line at a time, so a file or a record generator of
+any size is exported in constant memory. The columns of a record type are its
+field names, as in `Record.field_dict`, in layout order. Movements have the columns
+of their transaction record, followed by their joined `communication`. Dates are
+written as ISO strings, and amounts either as exact decimal strings or, with
+`milli_units`, as integer numbers of thousandths. Missing values are empty in CSV
+and null in JSON.
+"""
+
+from __future__ import unicode_literals
+
+import csv
+import json
+from functools import lru_cache
+from os import PathLike
+
+from pycoda.codafile import CodaFile
+from pycoda.fields import (
+    BalanceField,
+    DateField,
+    _amount,
+    _iso_date,
+    _unsigned_milli_units,
+)
+from pycoda.movement import itermovements
+from pycoda.records import TransactionRecord
+
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def _amount_string(value):
+    """Exact, unsigned decimal string of an amount, also when loaded as signed
+    milli-units: the sign is only exported in its own field"""
+    if value is None:
+        return None
+    if type(value) is int:
+        value = _amount(abs(value))
+    return str(value)
+
+
+@lru_cache(maxsize=None)
+def _columns(record_type, milli_units=False):
+    """Column names of a record type, and the value index and conversion (or
+    None) of each column"""
+    names = []
+    columns = []
+    for name, index in record_type._field_indexes.items():
+        field = record_type._fields[index]
+        convert = None
+        if isinstance(field, DateField):
+            convert = _iso_date
+        elif isinstance(field, BalanceField):
+            convert = _unsigned_milli_units if milli_units else _amount_string
+        names.append(name)
+        columns.append((index, convert))
+    return tuple(names), tuple(columns)
+
+
+def _row(record, columns):
+    """Converted values of a record, in column order"""
+    values = record._decoded_values()
+    return [
+        values[index] if convert is None else convert(values[index])
+        for index, convert in columns
+    ]
+
+
+def _records(source, record_types=None):
+    """Records of a CodaFile or an iterable, of the given types only if any"""
+    records = source.records if isinstance(source, CodaFile) else source
+    if record_types is None:
+        return iter(records)
+    return (record for record in records if isinstance(record, record_types))
+
+
+def to_csv(source, target, record_type, milli_units=False):
+    """Writes the records of a single type to a path or a text file object as CSV
+
+    `source` is a CodaFile or any iterable of records, such as `CodaFile.iterload`;
+    records of other types are skipped. The first row holds the column names.
+    Paths are written as UTF-8.
+    """
+    if isinstance(target, (str, PathLike)):
+        with open(target, "w", encoding="utf-8", newline="") as fp:
+            to_csv(source, fp, record_type, milli_units=milli_units)
+        return
+    names, columns = _columns(record_type, milli_units)
+    writer = csv.writer(target)
+    writer.writerow(names)
+    for record in _records(source, record_type):
+        writer.writerow(_row(record, columns))
+
+
+def to_jsonl(source, target, record_types=None, milli_units=False):
+    """Writes records to a path or a text file object as JSON Lines
+
+    Each record is written as an object of its field values on its own line.
+    `source` is a CodaFile or any iterable of records, optionally limited to a
+    record type or a tuple of them with `record_types`. Paths are written as UTF-8.
+    """
+    if isinstance(target, (str, PathLike)):
+        with open(target, "w", encoding="utf-8") as fp:
+            to_jsonl(source, fp, record_types=record_types, milli_units=milli_units)
+        return
+    for record in _records(source, record_types):
+        names, columns = _columns(type(record), milli_units)
+        target.write(_encode(dict(zip(names, _row(record, columns)))) + "\n")
+
+
+def _movement_rows(source, milli_units):
+    """Column names of movements, and a generator of their rows"""
+    names, columns = _columns(TransactionRecord, milli_units)
+    rows = (
+        _row(movement.transaction_record, columns) + [movement.communication]
+        for movement in itermovements(_records(source))
+    )
+    return names + ("communication",), rows
+
+
+def movements_to_csv(source, target, milli_units=False):
+    """Writes the movements of the records to a path or a text file object as CSV
+
+    `source` is a CodaFile or any iterable of records, grouped into movements by
+    `itermovements`. The first row holds the column names. Paths are written as
+    UTF-8.
+    """
+    if isinstance(target, (str, PathLike)):
+        with open(target, "w", encoding="utf-8", newline="") as fp:
+            movements_to_csv(source, fp, milli_units=milli_units)
+        return
+    names, rows = _movement_rows(source, milli_units)
+    writer = csv.writer(target)
+    writer.writerow(names)
+    writer.writerows(rows)
+
+
+def movements_to_jsonl(source, target, milli_units=False):
+    """Writes the movements of the records to a path or a text file object as JSON
+    Lines, see `movements_to_csv`"""
+    if isinstance(target, (str, PathLike)):
+        with open(target, "w", encoding="utf-8") as fp:
+            movements_to_jsonl(source, fp, milli_units=milli_units)
+        return
+    names, rows = _movement_rows(source, milli_units)
+    for row in rows:
+        target.write(_encode(dict(zip(names, row))) + "\n")
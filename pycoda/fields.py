@@ -2,8 +2,9 @@ from __future__ import unicode_literals
 
 import re
 from abc import ABCMeta, abstractmethod
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
+from functools import lru_cache
 
 from six import with_metaclass
 
@@ -19,6 +20,10 @@ class Field(with_metaclass(ABCMeta, object)):
     def _regex(self):
         """Regular expression used in loading the value from a string"""
 
+    @abstractmethod
+    def _group(self):
+        """Unanchored regular expression capturing the value in a single group"""
+
     def _parse(self, string):
         """Find match with regex and return if found"""
         match = re.match(self._regex(), string)
@@ -32,6 +37,34 @@ class Field(with_metaclass(ABCMeta, object)):
     def dumps(self):
         """Dump the value in the format such it can be picked up elsewhere"""
 
+    @abstractmethod
+    def _format(self, value):
+        """Dump the given value, as stored for this field by a record"""
+
+    @abstractmethod
+    def _cast(self, string):
+        """Convert the string captured by the field regex to the field value"""
+
+    def _cast_source(self, value, namespace, binary=False):
+        """Python expression casting the string ``value`` to the field value
+
+        Used to inline the cast in generated record loaders; any names the
+        expression refers to are added to ``namespace``. With ``binary``, ``value``
+        holds the raw bytes of the field and text is decoded with the loader's
+        ``encoding``. Fields without an inline expression return None and are cast
+        through :meth:`_cast` instead.
+        """
+        return None
+
+    def _format_source(self, value, namespace):
+        """Python expression dumping the value held by the name ``value``
+
+        Used to inline the formatting in generated record dumpers, the same way as
+        :meth:`_cast_source`. Fields without an inline expression return None and
+        are dumped through :meth:`_format` instead.
+        """
+        return None
+
     @abstractmethod
     def loads(self, string):
         """Parse value from given string, using the field's available regex"""
@@ -46,16 +79,36 @@ class StringField(Field):
     def _regex(self):
         return (r"^(?P<value>.{{{self.length}}})$").format(self=self)
 
+    def _group(self):
+        return (r"(.{{{self.length}}})").format(self=self)
+
     def _parse(self, string):
         return super(StringField, self)._parse(string)
 
+    def _cast(self, string):
+        return string
+
+    def _cast_source(self, value, namespace, binary=False):
+        if binary:
+            return "{value}.decode(encoding)".format(value=value)
+        return value
+
     def dumps(self):
-        value = self.value if self.value else ""
+        return self._format(self.value)
+
+    def _format(self, value):
+        value = value if value else ""
         dump_format = "{value:{self.pad}{self.align}{self.length}s}"
         return dump_format.format(self=self, value=value)[: self.length]
 
+    def _format_source(self, value, namespace):
+        spec = "{self.pad}{self.align}{self.length}s".format(self=self)
+        return "format({value} or '', {spec!r})[:{self.length}]".format(
+            self=self, value=value, spec=spec
+        )
+
     def loads(self, string):
-        self.value = self._parse(string)
+        self.value = self._cast(self._parse(string))
 
 
 class EmptyField(StringField):
@@ -65,12 +118,21 @@ class EmptyField(StringField):
     def _regex(self):
         return super(EmptyField, self)._regex()
 
+    def _group(self):
+        return super(EmptyField, self)._group()
+
     def _parse(self, string):
         return super(EmptyField, self)._parse(string)
 
+    def _cast(self, string):
+        return super(EmptyField, self)._cast(string)
+
     def dumps(self):
         return super(EmptyField, self).dumps()
 
+    def _format(self, value):
+        return super(EmptyField, self)._format(value)
+
     def loads(self, string):
         super(EmptyField, self).loads(string)
 
@@ -82,12 +144,21 @@ class ZeroesField(StringField):
     def _regex(self):
         return super(ZeroesField, self)._regex()
 
+    def _group(self):
+        return super(ZeroesField, self)._group()
+
     def _parse(self, string):
         return super(ZeroesField, self)._parse(string)
 
+    def _cast(self, string):
+        return super(ZeroesField, self)._cast(string)
+
     def dumps(self):
         return super(ZeroesField, self).dumps()
 
+    def _format(self, value):
+        return super(ZeroesField, self)._format(value)
+
     def loads(self, string):
         super(ZeroesField, self).loads(string)
 
@@ -108,11 +179,27 @@ class NumericField(StringField):
             self=self, length=length
         )
 
+    def _group(self):
+        length = self.length - len(self.head) - len(self.tail)
+        return (r"{head}([\d\s]{{{length}}}){tail}").format(
+            head=re.escape(self.head), length=length, tail=re.escape(self.tail)
+        )
+
     def _parse(self, string):
         return super(NumericField, self)._parse(string)
 
+    def _cast(self, string):
+        return int(string)
+
+    def _cast_source(self, value, namespace, binary=False):
+        # int() parses ASCII digits from bytes as well, no decoding needed
+        return "int({value})".format(value=value)
+
     def dumps(self):
-        value = self.value if self.value else 0
+        return self._format(self.value)
+
+    def _format(self, value):
+        value = value if value else 0
         length = self.length - len(self.head) - len(self.tail)
         value_string = ("{value:{self.pad}{self.align}{length}d}").format(
             self=self, value=value, length=length
@@ -122,11 +209,26 @@ class NumericField(StringField):
             self=self, truncated=truncated
         )
 
+    def _format_source(self, value, namespace):
+        length = self.length - len(self.head) - len(self.tail)
+        spec = "{self.pad}{self.align}{length}d".format(self=self, length=length)
+        source = "format({value} or 0, {spec!r})[:{length}]".format(
+            value=value, spec=spec, length=length
+        )
+        if self.head:
+            source = "{self.head!r} + {source}".format(self=self, source=source)
+        if self.tail:
+            source = "{source} + {self.tail!r}".format(self=self, source=source)
+        return source
+
     def loads(self, string):
-        self.value = int(self._parse(string))
+        self.value = self._cast(self._parse(string))
 
 
 class DateField(StringField):
+    DEFAULT_FORMAT = "%d%m%y"
+    CACHE_SIZE = 4096
+
     def __init__(
         self,
         position,
@@ -135,7 +237,7 @@ class DateField(StringField):
         tag=None,
         pad="",
         align="<",
-        date_format="%d%m%y",
+        date_format=DEFAULT_FORMAT,
     ):
         super(DateField, self).__init__(
             position, length, value=value, tag=tag, pad=pad, align=align
@@ -145,52 +247,175 @@ class DateField(StringField):
     def _regex(self):
         return r"^(?P<value>\d{{{self.length}}})$".format(self=self)
 
+    def _group(self):
+        return r"(\d{{{self.length}}})".format(self=self)
+
     def _parse(self, string):
         return super(DateField, self)._parse(string)
 
+    def _cast(self, string):
+        return _date(string, self.date_format)
+
+    def _cast_source(self, value, namespace, binary=False):
+        namespace["date"] = _date
+        return "date({value}, {self.date_format!r})".format(self=self, value=value)
+
     def dumps(self):
-        if self.value is None:
-            raise ValueError("No valid date value available")
-        dump_format = "{self.value:{self.date_format}}"
-        return dump_format.format(self=self)[: self.length]
+        return self._format(self.value)
+
+    def _format(self, value):
+        if value is None:
+            _no_date()
+        dump_format = "{value:{self.date_format}}"
+        return dump_format.format(self=self, value=value)[: self.length]
+
+    def _format_source(self, value, namespace):
+        namespace["no_date"] = _no_date
+        return (
+            "(format({value}, {self.date_format!r})[:{self.length}] "
+            "if {value} is not None else no_date())"
+        ).format(self=self, value=value)
 
     def loads(self, string):
-        date_string = self._parse(string)
-        self.value = datetime.strptime(date_string, self.date_format).date()
+        self.value = self._cast(self._parse(string))
+
+
+@lru_cache(maxsize=DateField.CACHE_SIZE)
+def _date(string, date_format=DateField.DEFAULT_FORMAT):
+    """Date of a field string or its raw bytes, memoised for all date fields
+
+    The same few dates recur throughout a file, so they are only decoded once.
+    The default format is sliced into integers directly, mapping two-digit years
+    onto 1969-2068 as `strptime` does.
+    """
+    if date_format == DateField.DEFAULT_FORMAT and len(string) == 6:
+        year = int(string[4:6])
+        year += 2000 if year < 69 else 1900
+        return date(year, int(string[2:4]), int(string[0:2]))
+    if not isinstance(string, str):
+        string = string.decode("ascii")
+    return datetime.strptime(string, date_format).date()
+
+
+def _iso_date(value):
+    """ISO string of a date value, cut as records built in code may hold datetimes"""
+    return None if value is None else value.isoformat()[:10]
+
+
+def _no_date():
+    raise ValueError("No valid date value available")
+
+
+def _balance(string):
+    """Balance amount with the implied decimal places applied"""
+    parsed_tuple = Decimal(string).as_tuple()
+    return Decimal(
+        (parsed_tuple.sign, parsed_tuple.digits, -BalanceField.DECIMAL_PLACES)
+    )
+
+
+def _amount(milli_units):
+    """Decimal amount of a number of thousandths, such as the raw bytes of a field
+    or an integer column, or None"""
+    if milli_units is None:
+        return None
+    return Decimal(int(milli_units)).scaleb(-BalanceField.DECIMAL_PLACES)
+
+
+def _milli_units(string, sign=None):
+    """Balance amount as an integer number of thousandths, straight from the field
+
+    With the string of the matching sign field, debit amounts are negative.
+    """
+    amount = int(string)
+    if sign is not None and int(sign) == BalanceField.DEBIT:
+        return -amount
+    return amount
+
+
+def _unsigned_milli_units(amount):
+    """Unsigned integer number of thousandths of a Decimal or integer milli-units
+    amount, or None: the sign of an amount is a field of its own"""
+    if amount is None:
+        return None
+    if type(amount) is int:
+        return abs(amount)
+    return int(amount.scaleb(BalanceField.DECIMAL_PLACES))
 
 
 class BalanceField(Field):
     LENGTH = 15
     DECIMAL_PLACES = 3
+    DEBIT = 1
 
-    def __init__(self, position, value=None, tag=None, pad="0"):
+    def __init__(self, position, value=None, tag=None, pad="0", sign=None):
+        """`sign` names the field holding the sign of the amount, if any"""
         super(BalanceField, self).__init__(
             position, BalanceField.LENGTH, value=value, tag=tag
         )
         self.pad = pad
+        self.sign = sign
 
     def _regex(self):
         raise NotImplementedError()
 
+    def _group(self):
+        return r"(.{{{self.LENGTH}}})".format(self=self)
+
     def _parse(self, string):
         raise NotImplementedError()
 
+    def _cast(self, string):
+        return _balance(string)
+
+    def _cast_source(self, value, namespace, binary=False):
+        if binary:
+            namespace["amount"] = _amount
+            return "amount({value})".format(value=value)
+        namespace["balance"] = _balance
+        return "balance({value})".format(value=value)
+
+    def _milli_units_source(self, value, sign, namespace):
+        """Python expression casting ``value`` to signed integer milli-units
+
+        ``sign`` holds the string of the sign field, or is None for unsigned
+        amounts.
+        """
+        namespace["milli_units"] = _milli_units
+        if sign is None:
+            return "milli_units({value})".format(value=value)
+        return "milli_units({value}, {sign})".format(value=value, sign=sign)
+
     def dumps(self):
-        if self.value is None:
+        return self._format(self.value)
+
+    def _format(self, value):
+        if type(value) is int:
+            # Integer milli-units, the sign is held by the sign field
+            return "{value:{self.pad}{self.LENGTH}d}".format(
+                self=self, value=abs(value)
+            )
+        if value is None:
             value_tuple = Decimal(0).as_tuple()
         else:
-            value_tuple = self.value.as_tuple()
+            value_tuple = value.as_tuple()
         # Always use a positive sign here
         shifted = Decimal((0, value_tuple.digits, 0))
         dump_format = "{shifted:{self.pad}{self.LENGTH}f}"
         return dump_format.format(self=self, shifted=shifted)
 
+    def _format_source(self, value, namespace):
+        # Only the digits are dumped, always with a positive sign
+        namespace["Decimal"] = Decimal
+        return (
+            "(format(abs({value}), '{self.pad}{self.LENGTH}d') "
+            "if type({value}) is int else "
+            "format(Decimal((0, (Decimal(0) if {value} is None else {value})"
+            ".as_tuple().digits, 0)), '{self.pad}{self.LENGTH}f'))"
+        ).format(self=self, value=value)
+
     def loads(self, string):
-        parsed = Decimal(string)
-        parsed_tuple = parsed.as_tuple()
-        self.value = Decimal(
-            (parsed_tuple.sign, parsed_tuple.digits, -BalanceField.DECIMAL_PLACES)
-        )
+        self.value = self._cast(string)
 
 
 class BooleanField(StringField):
@@ -208,14 +433,32 @@ class BooleanField(StringField):
     def _regex(self):
         return super(BooleanField, self)._regex()
 
+    def _group(self):
+        return super(BooleanField, self)._group()
+
     def _parse(self, string):
         return super(BooleanField, self)._parse(string)
 
+    def _cast(self, string):
+        return string == self.true_value
+
+    def _cast_source(self, value, namespace, binary=False):
+        true_value = self.true_value.encode("ascii") if binary else self.true_value
+        return "{value} == {true_value!r}".format(value=value, true_value=true_value)
+
     def dumps(self):
-        if self.value:
+        return self._format(self.value)
+
+    def _format(self, value):
+        if value:
             return self.true_value
         else:
             return self.false_value
 
+    def _format_source(self, value, namespace):
+        return "({self.true_value!r} if {value} else {self.false_value!r})".format(
+            self=self, value=value
+        )
+
     def loads(self, string):
-        self.value = self._parse(string) == self.true_value
+        self.value = self._cast(self._parse(string))
@@ -0,0 +1,90 @@
+"""Opt-in counters and timings of loading and dumping records"""
+
+from __future__ import unicode_literals
+
+from collections import Counter
+from time import perf_counter
+
+
+class Instrumentation(object):
+    """Counts lines and records, and times the stages of loading and dumping
+
+    Pass it to a `CodaFile` (or to `Record.loads` / `Record.dumps`) to enable it;
+    without one, none of this is measured. Timings are in seconds:
+
+      * `header_time`: dispatching each line to its record type, per record type
+      * `field_time`: decoding values, per field type, with `fields` counting them
+      * `dump_time`: dumping records, per record type, with `dumped` counting them
+
+    The values of records loaded lazily are not timed, as they are only decoded
+    on access. `callback`, if given, is called as `callback(stage, name, seconds)`
+    for every measurement, with stage `"header"`, `"field"` or `"dump"` and the
+    name of the record or field type.
+    """
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.lines = 0
+        self.records = Counter()
+        self.header_time = Counter()
+        self.fields = Counter()
+        self.field_time = Counter()
+        self.dumped = Counter()
+        self.dump_time = Counter()
+
+    def _measure(self, stage, counter, name, seconds):
+        counter[name] += seconds
+        if self.callback is not None:
+            self.callback(stage, name, seconds)
+
+    def load_record(self, coda_file, line, encoding):
+        """Record of a CodaFile line, counting the line and timing its loading"""
+        start = perf_counter()
+        record = coda_file._record_from_header(line)
+        name = type(record).__name__
+        self._measure("header", self.header_time, name, perf_counter() - start)
+        self.lines += 1
+        record.loads(
+            line,
+            encoding=encoding,
+            lazy=coda_file.lazy,
+            instrumentation=self,
+            milli_units=coda_file.milli_units,
+            interned=coda_file.interned,
+        )
+        self.records[name] += 1
+        return record
+
+    def decode(self, record, groups, encoding):
+        """Values of the matched groups of a record line, timing each cast"""
+        values = []
+        for field, value in zip(record._fields, groups):
+            start = perf_counter()
+            if not isinstance(value, str):
+                value = value.decode(encoding)
+            values.append(field._cast(value))
+            name = type(field).__name__
+            self._measure("field", self.field_time, name, perf_counter() - start)
+            self.fields[name] += 1
+        return values
+
+    def dumps(self, record):
+        """Dumped record, timing its serialisation"""
+        start = perf_counter()
+        string = record.dumps()
+        name = type(record).__name__
+        self._measure("dump", self.dump_time, name, perf_counter() - start)
+        self.dumped[name] += 1
+        return string
+
+    def as_dict(self):
+        """All counters and timings, as plain dicts"""
+        return {
+            "lines": self.lines,
+            "records": dict(self.records),
+            "header_time": dict(self.header_time),
+            "fields": dict(self.fields),
+            "field_time": dict(self.field_time),
+            "dumped": dict(self.dumped),
+            "dump_time": dict(self.dump_time),
+        }
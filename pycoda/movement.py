@@ -0,0 +1,141 @@
+from __future__ import unicode_literals
+
+from pycoda.records import (
+    InformationDetailRecord,
+    InformationPurposeRecord,
+    InformationRecord,
+    RecordIdentification,
+    TransactionDetailRecord,
+    TransactionPurposeRecord,
+    TransactionRecord,
+)
+
+MOVEMENT_IDENTIFICATIONS = (
+    RecordIdentification.TRANSACTION,
+    RecordIdentification.INFORMATION,
+)
+
+# Field holding the part of the free-text communication carried by each record
+TRANSACTION_COMMUNICATION = (
+    (TransactionRecord, "reference"),
+    (TransactionPurposeRecord, "bank_statement"),
+    (TransactionDetailRecord, "description"),
+)
+INFORMATION_COMMUNICATION = (
+    (InformationRecord, "reference"),
+    (InformationPurposeRecord, "bank_reference_number"),
+    (InformationDetailRecord, "bank_reference_number"),
+)
+
+
+class Movement(object):
+    """A transaction record, with the purpose, detail and information records
+    continuing it"""
+
+    def __init__(self, transaction_record):
+        self.records = [transaction_record]
+
+    def _records(self, record_type):
+        return [record for record in self.records if type(record) is record_type]
+
+    def _communication(self, parts):
+        return "".join(
+            getattr(record, name) or ""
+            for record_type, name in parts
+            for record in self._records(record_type)
+        ).rstrip()
+
+    @property
+    def transaction_record(self):
+        return self.records[0]
+
+    @property
+    def serial_number(self):
+        return self.transaction_record.serial_number
+
+    @property
+    def detail_number(self):
+        return self.transaction_record.detail_number
+
+    @property
+    def transaction_purpose_records(self):
+        return self._records(TransactionPurposeRecord)
+
+    @property
+    def transaction_detail_records(self):
+        return self._records(TransactionDetailRecord)
+
+    @property
+    def information_records(self):
+        """Information records of any article, in statement order"""
+        return [
+            record
+            for record in self.records
+            if record.IDENTIFICATION == RecordIdentification.INFORMATION
+        ]
+
+    @property
+    def communication(self):
+        """Free-text communication, joined from the transaction records on access"""
+        return self._communication(TRANSACTION_COMMUNICATION)
+
+    @property
+    def information_communication(self):
+        """Free-text communication, joined from the information records on access"""
+        return self._communication(INFORMATION_COMMUNICATION)
+
+
+def _has_next(record):
+    """Whether the continuation flags of a record announce another record
+
+    Records without a flag are taken to possibly be continued.
+    """
+    for name in ("transaction_sequence", "information_sequence"):
+        if getattr(record, name, True):
+            return True
+    return False
+
+
+def _continues(movement, record):
+    """Whether a record has the serial and detail number of the movement"""
+    if movement is None:
+        return False
+    return (record.serial_number, record.detail_number) == (
+        movement.serial_number,
+        movement.detail_number,
+    )
+
+
+def itermovements(records):
+    """Generates a Movement for each transaction record, in a single pass
+
+    The purpose, detail and information records following a transaction record
+    with the same serial and detail number are added to its movement. The movement is
+    generated once the continuation flags announce no further record, or else at
+    the next record that doesn't continue it. Other records are skipped.
+    """
+    movement = None
+    for record in records:
+        if isinstance(record, TransactionRecord):
+            if movement is not None:
+                yield movement
+            movement = Movement(record)
+        elif record.IDENTIFICATION in MOVEMENT_IDENTIFICATIONS:
+            if not _continues(movement, record):
+                raise ValueError(
+                    "Record with serial number {} and detail number {} does not "
+                    "continue a movement".format(
+                        record.serial_number, record.detail_number
+                    )
+                )
+            movement.records.append(record)
+        else:
+            if movement is not None:
+                yield movement
+            movement = None
+            continue
+        if not _has_next(record):
+            yield movement
+            movement = None
+    if movement is not None:
+        yield movement
@@ -0,0 +1,98 @@
+"""Parsing CODA files in parallel, on a pool of worker processes"""
+
+from __future__ import unicode_literals
+
+import os
+from collections import namedtuple
+from multiprocessing import Pool
+
+from pycoda.codafile import RECORD_TYPES, CodaFile
+from pycoda.records import DEFAULT_ENCODING
+
+RANGES_PER_PROCESS = 4
+
+_TYPE_INDEXES = {record_type: index for index, record_type in enumerate(RECORD_TYPES)}
+
+ParseResult = namedtuple("ParseResult", ("path", "coda_file", "error"))
+ParseResult.__doc__ = "Outcome of parsing a single file: its CodaFile or the error"
+
+
+def _parse_path(arguments):
+    """Parse the file at a path, catching errors so they don't abort the batch"""
+    path, encoding = arguments
+    try:
+        coda_file = CodaFile(list(CodaFile().iterload(path, encoding=encoding)))
+    except Exception as error:
+        return ParseResult(path, None, error)
+    return ParseResult(path, coda_file, None)
+
+
+def parse_many(
+    paths, processes=None, chunksize=1, ordered=True, encoding=DEFAULT_ENCODING
+):
+    """Generates a ParseResult for each path, parsing the files in parallel
+
+    The files are parsed by a pool of `processes` workers (by default, one per
+    CPU core), which are handed `chunksize` paths at a time. With `ordered`, the
+    results follow the order of `paths`, otherwise they are generated as soon as
+    they are completed. A file that fails to parse yields a result holding the
+    error instead of a CodaFile, without stopping the other files.
+    """
+    arguments = ((path, encoding) for path in paths)
+    with Pool(processes) as pool:
+        imap = pool.imap if ordered else pool.imap_unordered
+        yield from imap(_parse_path, arguments, chunksize)
+
+
+def _byte_ranges(path, count):
+    """Cut a file into at most `count` byte ranges of whole lines"""
+    size = os.path.getsize(path)
+    boundaries = [0]
+    with open(path, "rb") as fp:
+        for index in range(1, count):
+            # Move on to the start of the next line, unless already at one
+            fp.seek(max(size * index // count - 1, 0))
+            fp.readline()
+            boundaries.append(fp.tell())
+    boundaries.append(size)
+    return [
+        (start, end) for start, end in zip(boundaries, boundaries[1:]) if start < end
+    ]
+
+
+def _parse_range(arguments):
+    """Parse the records in a byte range of a file
+
+    The records are returned as the index of their type and their `_state`, which
+    take much less time to pickle than Record instances.
+    """
+    path, start, end, encoding, lazy, milli_units = arguments
+    coda_file = CodaFile(lazy=lazy, milli_units=milli_units)
+    with open(path, "rb") as fp:
+        fp.seek(start)
+        coda_file.loads(fp.read(end - start), encoding=encoding)
+    return [
+        (_TYPE_INDEXES[type(record)], record._state()) for record in coda_file.records
+    ]
+
+
+def parse_ranges(
+    path, processes=None, encoding=DEFAULT_ENCODING, lazy=False, milli_units=False
+):
+    """Generates the records of a single large file, parsed in parallel, in order
+
+    The file is cut at line boundaries into `RANGES_PER_PROCESS` byte ranges per
+    worker process (by default, one per CPU core). The ranges are parsed
+    separately and their records are generated in file order as soon as each
+    range is done, so only the ranges in flight are held in memory. `lazy` and
+    `milli_units` are passed on to the CodaFile of each worker.
+    """
+    processes = processes or os.cpu_count()
+    arguments = [
+        (path, start, end, encoding, lazy, milli_units)
+        for start, end in _byte_ranges(path, processes * RANGES_PER_PROCESS)
+    ]
+    with Pool(processes) as pool:
+        for states in pool.imap(_parse_range, arguments):
+            for index, state in states:
+                yield RECORD_TYPES[index]._from_state(state, encoding)
@@ -5,11 +5,130 @@ from pycoda.fields import (
     BooleanField,
     DateField,
     EmptyField,
+    Field,
     NumericField,
     StringField,
     ZeroesField,
+    _milli_units,
 )
 
+DEFAULT_ENCODING = "latin-1"
+
+_LOADER_TEMPLATE = """\
+def loads(record, string, encoding):
+    match = regex.fullmatch(string)
+    if match is None:
+        no_match(string)
+    {values} = match.groups()
+    fields = record._fields
+    record._values = [
+{casts}
+    ]
+"""
+
+
+def _compile_loader(name, fields, regex, milli_units=None):
+    """Generate a loads function, with all field casts inlined, for a layout
+
+    The function takes a record, a line and its encoding, matches the line once and
+    stores the cast values straight in a new value list of the record, without any
+    per-field dispatch. For a bytes regex, the line can be any bytes-like object and
+    values are cast straight from the matched bytes; only text fields are decoded,
+    using the given encoding.
+
+    `milli_units` maps the indexes of the amounts to load as integer milli-units
+    to the index of their sign field, or None.
+    """
+    namespace = {"regex": regex, "no_match": _no_match}
+    binary = isinstance(regex.pattern, bytes)
+    milli_units = milli_units or {}
+    values = []
+    casts = []
+    for index, field in enumerate(fields):
+        value = "value{index}".format(index=index)
+        values.append(value + ",")
+        if index in milli_units:
+            sign = milli_units[index]
+            if sign is not None:
+                sign = "value{sign}".format(sign=sign)
+            cast = field._milli_units_source(value, sign, namespace)
+        else:
+            cast = field._cast_source(value, namespace, binary=binary)
+        if cast is None:
+            text = value + ".decode(encoding)" if binary else value
+            cast = "fields[{index}]._cast({text})".format(index=index, text=text)
+        casts.append("        {cast},".format(cast=cast))
+    source = _LOADER_TEMPLATE.format(values=" ".join(values), casts="\n".join(casts))
+    exec(compile(source, "<{name} loader>".format(name=name), "exec"), namespace)
+    return namespace["loads"]
+
+
+_DUMPER_TEMPLATE = """\
+def dumps(values):
+    {values} = values
+    return "".join((
+{formats}
+    ))
+"""
+
+
+def _compile_dumper(name, fields):
+    """Generate a dumps function, with all field formatting inlined, for a layout
+
+    The function takes the value list of a record and renders the whole line in a
+    single pass, with the format specifications of the fields computed up front.
+    """
+    namespace = {"fields": fields}
+    values = []
+    formats = []
+    for index, field in enumerate(fields):
+        value = "value{index}".format(index=index)
+        values.append(value + ",")
+        source = field._format_source(value, namespace)
+        if source is None:
+            source = "fields[{index}]._format({value})".format(index=index, value=value)
+        formats.append("        {source},".format(source=source))
+    source = _DUMPER_TEMPLATE.format(
+        values=" ".join(values), formats="\n".join(formats)
+    )
+    exec(compile(source, "<{name} dumper>".format(name=name), "exec"), namespace)
+    return namespace["dumps"]
+
+
+def _no_match(string):
+    if not isinstance(string, (str, bytes)):
+        # Shows the content of buffer slices, instead of their address
+        string = bytes(string)
+    raise ValueError("Specified string {} does not match record regex".format(string))
+
+
+class _FieldValue(object):
+    """Class-level descriptor giving access to the value of a record field"""
+
+    def __init__(self, index):
+        self.index = index
+
+    def __get__(self, record, owner=None):
+        if record is None:
+            return self
+        if record._undecoded and self.index in record._undecoded:
+            record._decode(self.index)
+        return record._values[self.index]
+
+    def __set__(self, record, value):
+        if record._undecoded and self.index in record._undecoded:
+            del record._undecoded[self.index]
+        # The source line no longer holds the record values
+        record._raw = None
+        record._values[self.index] = value
+        if type(value) is int and value:
+            sign = record._amounts.get(self.index)
+            if sign is not None:
+                # Signed milli-units: the sign field follows the sign of the amount
+                if record._undecoded:
+                    record._undecoded.pop(sign, None)
+                record._values[sign] = BalanceField.DEBIT if value < 0 else 0
+
 
 class RecordIdentification(object):
     INITIAL = 0
@@ -28,44 +147,271 @@ class RecordArticle(object):
 
 
 class Record(object):
+    """Base class of the records, laid out by the fields declared on the class
+
+    Each field is declared once, as a class attribute `_<name>_field` (optionally
+    followed by digits), and is shared by all instances of the class: it only
+    holds the layout and the default value. The values of a record are kept in a
+    single list, and the value of each field is accessible as `<name>`.
+    """
+
     IDENTIFICATION = None
     ARTICLE = None
-
-    def __init__(self):
-        self._fields = ()
-
-    def __getattr__(self, item):
-        """By implementing this, all the fields their values are accessible"""
-        field_name = "_{item}_field".format(item=item)
-        if field_name not in self.__dict__.keys():
-            raise AttributeError("Unknown value")
-        return self.__dict__[field_name].value
-
-    def __setattr__(self, key, value):
-        """By implementing this, all the fields their values are accessible"""
-        field_name = "_{key}_field".format(key=key)
-        if field_name in self.__dict__.keys():
-            self.__dict__[field_name].value = value
+    # Names of the string fields whose values repeat throughout a file
+    INTERNED = (
+        "account_holder_name",
+        "account_number",
+        "addressee",
+        "bic",
+        "purpose_category",
+    )
+
+    # Class layout, see _install_fields
+    _fields = ()
+    _field_keys = ()
+    _field_indexes = {}
+    _columns = ()
+    _defaults = ()
+    _amounts = {}
+    _interned = ()
+
+    # Values, plus the load state: the source line, kept until a field is set, and
+    # the raw values of the fields left undecoded by a lazy load
+    __slots__ = ("_values", "_raw", "_undecoded", "_encoding")
+
+    def __init_subclass__(cls, **kwargs):
+        super(Record, cls).__init_subclass__(**kwargs)
+        cls._install_fields()
+
+    def __init__(self, **values):
+        self._values = list(self._defaults)
+        self._raw = self._undecoded = None
+        self._encoding = DEFAULT_ENCODING
+        for name, value in values.items():
+            if value is not None:
+                setattr(self, name, value)
+
+    @classmethod
+    def _install_fields(cls):
+        """Collect the field layout of the class and expose the field values
+
+        The fields are taken in declaration order, including the ones declared on
+        base classes. `_field_indexes` maps the names used by `field_dict` to field
+        indexes. `_columns` pairs every field with a unique column name, the name
+        followed by the digits of numbered fields, such as `information_sequence0`.
+        """
+        attributes = {}
+        for klass in reversed(cls.__mro__):
+            for key, field in vars(klass).items():
+                if isinstance(field, Field):
+                    attributes[key] = field
+        cls._fields = tuple(attributes.values())
+        cls._field_keys = tuple(attributes)
+        cls._defaults = tuple(field.value for field in cls._fields)
+        regex = re.compile(r"^_(?P<name>((\w+)(_)?)+)_field")
+        field_indexes = {}
+        for index, key in enumerate(cls._field_keys):
+            match = regex.match(key)
+            if match is None:
+                continue
+            field_indexes[match.group("name")] = index
+            name = key[1 : -len("_field")]
+            if key.endswith("_field") and (
+                not hasattr(cls, name) or isinstance(getattr(cls, name), _FieldValue)
+            ):
+                setattr(cls, name, _FieldValue(index))
+        cls._field_indexes = field_indexes
+        column_regex = re.compile(r"^_(?P<name>\w+)_field(?P<index>\d*)$")
+        columns = []
+        for key, field in zip(cls._field_keys, cls._fields):
+            match = column_regex.match(key)
+            name = key if match is None else match.group("name") + match.group("index")
+            columns.append((name, field))
+        cls._columns = tuple(columns)
+        cls._interned = tuple(
+            field_indexes[name] for name in cls.INTERNED if name in field_indexes
+        )
+        cls._amounts = {
+            index: (
+                None
+                if field.sign is None
+                else cls._field_keys.index("_{}_field".format(field.sign))
+            )
+            for index, field in enumerate(cls._fields)
+            if isinstance(field, BalanceField)
+        }
+
+    def _decode(self, index):
+        """Decode the value of a field left undecoded by a lazy load"""
+        string = self._undecoded.pop(index)
+        if not isinstance(string, str):
+            string = string.decode(self._encoding)
+        self._values[index] = self._fields[index]._cast(string)
+
+    def _decode_all(self):
+        while self._undecoded:
+            self._decode(next(iter(self._undecoded)))
+
+    def dumps(self, instrumentation=None):
+        """String representation of the record, timed by `instrumentation`"""
+        if instrumentation is not None:
+            return instrumentation.dumps(self)
+        if self._raw is not None:
+            # Untouched record: its source line is its exact representation
+            if isinstance(self._raw, str):
+                return self._raw
+            return self._raw.decode(self._encoding)
+        self._decode_all()
+        return self._dumper()(self._values)
+
+    def _line_regex(self, binary=False):
+        """Compiled regular expression matching a full line, one group per field
+
+        The expression only depends on the field layout, so it is built once for
+        each record class and cached on that class. With `binary`, it matches
+        bytes-like lines instead.
+        """
+        cls = type(self)
+        attribute = "_compiled_binary_line_regex" if binary else "_compiled_line_regex"
+        regex = cls.__dict__.get(attribute)
+        if regex is None:
+            pattern = "".join(field._group() for field in self._fields)
+            regex = re.compile(pattern.encode("ascii") if binary else pattern)
+            setattr(cls, attribute, regex)
+        return regex
+
+    def _loader(self, binary=False, milli_units=False):
+        """Loader function generated from the field layout, cached on the class"""
+        cls = type(self)
+        attribute = "_compiled{binary}{milli_units}_loader".format(
+            binary="_binary" if binary else "",
+            milli_units="_milli_units" if milli_units else "",
+        )
+        loader = cls.__dict__.get(attribute)
+        if loader is None:
+            regex = self._line_regex(binary=binary)
+            amounts = self._amounts if milli_units else None
+            loader = _compile_loader(cls.__name__, self._fields, regex, amounts)
+            setattr(cls, attribute, loader)
+        return loader
+
+    def _load_milli_units(self, groups):
+        """Replace the amounts by integer milli-units, cast from the matched groups"""
+        for index, sign in self._amounts.items():
+            self._values[index] = _milli_units(
+                groups[index], None if sign is None else groups[sign]
+            )
+            if self._undecoded:
+                self._undecoded.pop(index, None)
+
+    def _intern(self, table):
+        """Replace the values of the `INTERNED` fields by the equal ones in `table`"""
+        values = self._values
+        for index in self._interned:
+            if self._undecoded and index in self._undecoded:
+                self._decode(index)
+            value = values[index]
+            values[index] = table.setdefault(value, value)
+
+    def _dumper(self):
+        """Dumper function generated from the field layout, cached on the class"""
+        cls = type(self)
+        dumper = cls.__dict__.get("_compiled_dumper")
+        if dumper is None:
+            dumper = _compile_dumper(cls.__name__, self._fields)
+            cls._compiled_dumper = dumper
+        return dumper
+
+    def _match(self, string, binary):
+        match = self._line_regex(binary=binary).fullmatch(string)
+        if match is None:
+            _no_match(string)
+        return match
+
+    def loads(
+        self,
+        string,
+        encoding=DEFAULT_ENCODING,
+        lazy=False,
+        instrumentation=None,
+        milli_units=False,
+        interned=None,
+    ):
+        """Load the field values from a line
+
+        The line is either a string or a bytes-like object, such as a memoryview
+        slice of a larger buffer. Only the text fields of bytes-like lines are
+        decoded, with `encoding`; the other values are parsed from the bytes.
+
+        With `lazy`, the line is only validated and each field value is decoded
+        the first time it is accessed.
+
+        A str or bytes line is kept, and dumped as is until a field is set. Slices
+        of a larger buffer are parsed in place instead, without copying them, and
+        are not kept, not to hold on to the buffer they are taken from: these
+        records dump their values, which may differ from a non-canonical line,
+        e.g. in the padding of numbers. Lazy loads do keep a copy of such a line,
+        as they copy the values of all its fields anyway.
+
+        With `instrumentation`, the values are decoded field by field to time them.
+
+        With `milli_units`, balances and amounts are loaded as integer numbers of
+        thousandths instead of Decimals, negative when their sign field holds the
+        debit sign. Setting a non-zero integer amount sets its sign field to match.
+
+        `interned` is a dict shared by the records of a file or parsing session:
+        the values of the `INTERNED` fields are looked up in it, so that equal
+        values share a single string. These are decoded right away, even when lazy.
+        """
+        binary = not isinstance(string, str)
+        if lazy and not isinstance(string, (str, bytes)):
+            string = bytes(string)
+        if lazy or instrumentation is not None:
+            groups = self._match(string, binary).groups()
+            if lazy:
+                self._undecoded = dict(enumerate(groups))
+            else:
+                self._values = instrumentation.decode(self, groups, encoding)
+                self._undecoded = None
+            if milli_units:
+                # Amounts are cast right away, along with their sign
+                self._load_milli_units(groups)
         else:
-            super(Record, self).__setattr__(key, value)
-
-    def dumps(self):
-        return "".join(field.dumps() for field in self._fields)
-
-    def loads(self, string):
-        for field in self._fields:
-            field.loads(string[field.position : field.position + field.length])
+            self._loader(binary=binary, milli_units=milli_units)(self, string, encoding)
+            self._undecoded = None
+        self._raw = string if isinstance(string, (str, bytes)) else None
+        self._encoding = encoding
+        if interned is not None:
+            self._intern(interned)
+
+    def _state(self):
+        """Load state as plain values, much cheaper to pickle than the record"""
+        return self._raw, self._values, self._undecoded
+
+    @classmethod
+    def _from_state(cls, state, encoding=DEFAULT_ENCODING):
+        """Record restored from its `_state`"""
+        record = cls.__new__(cls)
+        record._raw, record._values, record._undecoded = state
+        record._encoding = encoding
+        return record
+
+    @classmethod
+    def _from_values(cls, values):
+        """Record holding decoded field values, in layout order"""
+        record = cls()
+        record._values = list(values)
+        return record
+
+    def _decoded_values(self):
+        """All field values, in layout order, decoding the ones left undecoded"""
+        self._decode_all()
+        return self._values
 
     def field_dict(self):
         """Dict-like representation of all field values"""
-        regex = re.compile(r"^_(?P<name>((\w+)(_)?)+)_field")
-        dictionary = {}
-        for key, field in self.__dict__.items():
-            if field in self._fields:
-                match = regex.match(key)
-                if match is not None:
-                    dictionary[match.group("name")] = field.value
-        return dictionary
+        values = self._decoded_values()
+        return {name: values[index] for name, index in self._field_indexes.items()}
 
 
 class InitialRecord(Record):
@@ -74,6 +420,24 @@ class InitialRecord(Record):
     APPLICATION_CODE = "05"
     VERSION_CODE = 2
 
+    _identification_field = NumericField(0, 1, value=IDENTIFICATION)
+    _zeroes_field = ZeroesField(1, 4)
+    _creation_date_field = DateField(5, 6)
+    _bank_identification_number_field = NumericField(11, 3)
+    _application_code_field = StringField(14, 2, value=APPLICATION_CODE)
+    _duplicate_field = BooleanField(16, 1, value=None, true_value="D", false_value=" ")
+    _empty_field0 = EmptyField(17, 7)
+    _reference_field = StringField(24, 10)
+    _addressee_field = StringField(34, 26)
+    _bic_field = StringField(60, 11)
+    _account_holder_reference_field = NumericField(71, 11, head="0")
+    _empty_field1 = EmptyField(82, 1)
+    _free_field = StringField(83, 5)
+    _transaction_reference_field = StringField(88, 16, tag="20/1")
+    _related_reference_field = StringField(104, 16, tag="21/1")
+    _empty_field2 = EmptyField(120, 7)
+    _version_code_field = NumericField(127, 1, value=VERSION_CODE)
+
     def __init__(
         self,
         creation_date=None,
@@ -87,60 +451,17 @@ class InitialRecord(Record):
         transaction_reference=None,
         related_reference=None,
     ):
-        super(Record, self).__init__()
-
-        self._identification_field = NumericField(
-            0, 1, value=InitialRecord.IDENTIFICATION
-        )
-        self._zeroes_field = ZeroesField(1, 4)
-        self._creation_date_field = DateField(5, 6, value=creation_date)
-        self._bank_identification_number_field = NumericField(
-            11, 3, value=bank_identification_number
-        )
-        self._application_code_field = StringField(
-            14, 2, value=InitialRecord.APPLICATION_CODE
-        )
-        self._duplicate_field = BooleanField(
-            16, 1, value=is_duplicate, true_value="D", false_value=" "
-        )
-        self._empty_field0 = EmptyField(17, 7)
-        self._reference_field = StringField(24, 10, value=reference)
-        self._addressee_field = StringField(34, 26, value=addressee)
-        self._bic_field = StringField(60, 11, value=bic)
-        self._account_holder_reference_field = NumericField(
-            71, 11, value=account_holder_reference, head="0"
-        )
-        self._empty_field1 = EmptyField(82, 1)
-        self._free_field = StringField(83, 5, value=free)
-        self._transaction_reference_field = StringField(
-            88, 16, value=transaction_reference, tag="20/1"
-        )
-        self._related_reference_field = StringField(
-            104, 16, value=related_reference, tag="21/1"
-        )
-        self._empty_field2 = EmptyField(120, 7)
-        self._version_code_field = NumericField(
-            127, 1, value=InitialRecord.VERSION_CODE
-        )
-
-        self._fields = (
-            self._identification_field,
-            self._zeroes_field,
-            self._creation_date_field,
-            self._bank_identification_number_field,
-            self._application_code_field,
-            self._duplicate_field,
-            self._empty_field0,
-            self._reference_field,
-            self._addressee_field,
-            self._bic_field,
-            self._account_holder_reference_field,
-            self._empty_field1,
-            self._free_field,
-            self._transaction_reference_field,
-            self._related_reference_field,
-            self._empty_field2,
-            self._version_code_field,
+        super(InitialRecord, self).__init__(
+            creation_date=creation_date,
+            bank_identification_number=bank_identification_number,
+            duplicate=is_duplicate,
+            reference=reference,
+            addressee=addressee,
+            bic=bic,
+            account_holder_reference=account_holder_reference,
+            free=free,
+            transaction_reference=transaction_reference,
+            related_reference=related_reference,
         )
 
 
@@ -148,6 +469,17 @@ class OldBalanceRecord(Record):
     IDENTIFICATION = RecordIdentification.OLD_BALANCE
     ARTICLE = None
 
+    _identification_field = NumericField(0, 1, value=IDENTIFICATION)
+    _account_structure_field = NumericField(1, 1)
+    _serial_number_field = NumericField(2, 3, tag="28c/1")
+    _account_number_field = StringField(5, 37)
+    _balance_sign_field = NumericField(42, 1, tag="60F/1")
+    _old_balance_field = BalanceField(43, tag="60F/4", sign="balance_sign")
+    _balance_date_field = DateField(58, 6, tag="60F/2")
+    _account_holder_name_field = StringField(64, 26)
+    _account_description_field = StringField(90, 35)
+    _bank_statement_serial_number_field = NumericField(125, 3)
+
     def __init__(
         self,
         account_structure=None,
@@ -160,34 +492,16 @@ class OldBalanceRecord(Record):
         account_description=None,
         bank_statement_serial_number=None,
     ):
-        super(OldBalanceRecord, self).__init__()
-
-        self._identification_field = NumericField(
-            0, 1, value=OldBalanceRecord.IDENTIFICATION
-        )
-        self._account_structure_field = NumericField(1, 1, value=account_structure)
-        self._serial_number_field = NumericField(2, 3, value=serial_number, tag="28c/1")
-        self._account_number_field = StringField(5, 37, value=account_number)
-        self._balance_sign_field = NumericField(42, 1, value=balance_sign, tag="60F/1")
-        self._old_balance_field = BalanceField(43, value=old_balance, tag="60F/4")
-        self._balance_date_field = DateField(58, 6, value=balance_date, tag="60F/2")
-        self._account_holder_name_field = StringField(64, 26, value=account_holder_name)
-        self._account_description_field = StringField(90, 35, value=account_description)
-        self._bank_statement_serial_number_field = NumericField(
-            125, 3, value=bank_statement_serial_number
-        )
-
-        self._fields = (
-            self._identification_field,
-            self._account_structure_field,
-            self._serial_number_field,
-            self._account_number_field,
-            self._balance_sign_field,
-            self._old_balance_field,
-            self._balance_date_field,
-            self._account_holder_name_field,
-            self._account_description_field,
-            self._bank_statement_serial_number_field,
+        super(OldBalanceRecord, self).__init__(
+            account_structure=account_structure,
+            serial_number=serial_number,
+            account_number=account_number,
+            balance_sign=balance_sign,
+            old_balance=old_balance,
+            balance_date=balance_date,
+            account_holder_name=account_holder_name,
+            account_description=account_description,
+            bank_statement_serial_number=bank_statement_serial_number,
         )
 
 
@@ -195,6 +509,28 @@ class TransactionRecord(Record):
     IDENTIFICATION = RecordIdentification.TRANSACTION
     ARTICLE = RecordArticle.DEFAULT
 
+    _identification_field = NumericField(0, 1, value=IDENTIFICATION)
+    _article_field = NumericField(1, 1, value=ARTICLE)
+    _serial_number_field = NumericField(2, 4)
+    _detail_number_field = NumericField(6, 4)
+    _bank_reference_number_field = StringField(10, 21, tag="61/8")
+    _balance_sign_field = NumericField(31, 1, tag="61/3")
+    _balance_field = BalanceField(32, tag="61/5", sign="balance_sign")
+    _balance_date_field = DateField(47, 6, tag="61/1")
+    _transaction_code_field = NumericField(53, 8, tag="61/6")
+    _reference_type_field = NumericField(61, 1)
+    _reference_field = StringField(62, 53, tag="61/9")
+    _booking_date_field = DateField(115, 6, tag="61/2")
+    _bank_statement_serial_number_field = NumericField(121, 3, tag="28/c")
+    _globalisation_code_field = NumericField(124, 1)
+    _transaction_sequence_field = BooleanField(
+        125, 1, value=None, true_value="1", false_value="0"
+    )
+    _empty_field = EmptyField(126, 1)
+    _information_sequence_field = BooleanField(
+        127, 1, value=None, true_value="1", false_value="0"
+    )
+
     def __init__(
         self,
         serial_number=None,
@@ -212,56 +548,21 @@ class TransactionRecord(Record):
         transaction_sequence=None,
         information_sequence=None,
     ):
-        super(TransactionRecord, self).__init__()
-
-        self._identification_field = NumericField(
-            0, 1, value=TransactionPurposeRecord.IDENTIFICATION
-        )
-        self._article_field = NumericField(1, 1, value=TransactionRecord.ARTICLE)
-        self._serial_number_field = NumericField(2, 4, value=serial_number)
-        self._detail_number_field = NumericField(6, 4, value=detail_number)
-        self._bank_reference_number_field = StringField(
-            10, 21, value=bank_reference_number, tag="61/8"
-        )
-        self._balance_sign_field = NumericField(31, 1, value=balance_sign, tag="61/3")
-        self._balance_field = BalanceField(32, value=balance, tag="61/5")
-        self._balance_date_field = DateField(47, 6, value=balance_date, tag="61/1")
-        self._transaction_code_field = NumericField(
-            53, 8, value=transaction_code, tag="61/6"
-        )
-        self._reference_type_field = NumericField(61, 1, value=reference_type)
-        self._reference_field = StringField(62, 53, value=reference, tag="61/9")
-        self._booking_date_field = DateField(115, 6, value=booking_date, tag="61/2")
-        self._bank_statement_serial_number_field = NumericField(
-            121, 3, value=bank_statement_serial_number, tag="28/c"
-        )
-        self._globalisation_code_field = NumericField(124, 1, value=globalisation_code)
-        self._transaction_sequence_field = BooleanField(
-            125, 1, value=transaction_sequence, true_value="1", false_value="0"
-        )
-        self._empty_field = EmptyField(126, 1)
-        self._information_sequence_field = BooleanField(
-            127, 1, value=information_sequence, true_value="1", false_value="0"
-        )
-
-        self._fields = (
-            self._identification_field,
-            self._article_field,
-            self._serial_number_field,
-            self._detail_number_field,
-            self._bank_reference_number_field,
-            self._balance_sign_field,
-            self._balance_field,
-            self._balance_date_field,
-            self._transaction_code_field,
-            self._reference_type_field,
-            self._reference_field,
-            self._booking_date_field,
-            self._bank_statement_serial_number_field,
-            self._globalisation_code_field,
-            self._transaction_sequence_field,
-            self._empty_field,
-            self._information_sequence_field,
+        super(TransactionRecord, self).__init__(
+            serial_number=serial_number,
+            detail_number=detail_number,
+            bank_reference_number=bank_reference_number,
+            balance_sign=balance_sign,
+            balance=balance,
+            balance_date=balance_date,
+            transaction_code=transaction_code,
+            reference_type=reference_type,
+            reference=reference,
+            booking_date=booking_date,
+            bank_statement_serial_number=bank_statement_serial_number,
+            globalisation_code=globalisation_code,
+            transaction_sequence=transaction_sequence,
+            information_sequence=information_sequence,
         )
 
 
@@ -269,6 +570,24 @@ class TransactionPurposeRecord(Record):
     IDENTIFICATION = RecordIdentification.TRANSACTION
     ARTICLE = RecordArticle.PURPOSE
 
+    _identification_field = NumericField(0, 1, value=IDENTIFICATION)
+    _article_field = NumericField(1, 1, value=ARTICLE)
+    _serial_number_field = NumericField(2, 4)
+    _detail_number_field = NumericField(6, 4)
+    _bank_statement_field = StringField(10, 53)
+    _client_reference_field = StringField(63, 35)
+    _bic_field = StringField(98, 11)
+    _empty_field0 = EmptyField(109, 8)
+    _purpose_category_field = StringField(117, 4)
+    _purpose_field = StringField(121, 4)
+    _transaction_sequence_field = BooleanField(
+        125, 1, value=None, true_value="1", false_value="0"
+    )
+    _empty_field1 = EmptyField(126, 1)
+    _information_sequence_field = BooleanField(
+        127, 1, value=None, true_value="1", false_value="0"
+    )
+
     def __init__(
         self,
         serial_number=None,
@@ -281,42 +600,16 @@ class TransactionPurposeRecord(Record):
         transaction_sequence=None,
         information_sequence=None,
     ):
-        super(Record, self).__init__()
-
-        self._identification_field = NumericField(
-            0, 1, value=TransactionPurposeRecord.IDENTIFICATION
-        )
-        self._article_field = NumericField(1, 1, value=TransactionPurposeRecord.ARTICLE)
-        self._serial_number_field = NumericField(2, 4, value=serial_number)
-        self._detail_number_field = NumericField(6, 4, value=detail_number)
-        self._bank_statement_field = StringField(10, 53, value=bank_statement)
-        self._client_reference_field = StringField(63, 35, value=client_reference)
-        self._bic_field = StringField(98, 11, value=bic)
-        self._empty_field0 = EmptyField(109, 8)
-        self._purpose_category_field = StringField(117, 4, value=purpose_category)
-        self._purpose_field = StringField(121, 4, value=purpose)
-        self._transaction_sequence_field = BooleanField(
-            125, 1, value=transaction_sequence, true_value="1", false_value="0"
-        )
-        self._empty_field1 = EmptyField(126, 1)
-        self._information_sequence_field = BooleanField(
-            127, 1, value=information_sequence, true_value="1", false_value="0"
-        )
-
-        self._fields = (
-            self._identification_field,
-            self._article_field,
-            self._serial_number_field,
-            self._detail_number_field,
-            self._bank_statement_field,
-            self._client_reference_field,
-            self._bic_field,
-            self._empty_field0,
-            self._purpose_category_field,
-            self._purpose_field,
-            self._transaction_sequence_field,
-            self._empty_field1,
-            self._information_sequence_field,
+        super(TransactionPurposeRecord, self).__init__(
+            serial_number=serial_number,
+            detail_number=detail_number,
+            bank_statement=bank_statement,
+            client_reference=client_reference,
+            bic=bic,
+            purpose_category=purpose_category,
+            purpose=purpose,
+            transaction_sequence=transaction_sequence,
+            information_sequence=information_sequence,
         )
 
 
@@ -324,6 +617,19 @@ class TransactionDetailRecord(Record):
     IDENTIFICATION = RecordIdentification.TRANSACTION
     ARTICLE = RecordArticle.DETAIL
 
+    _identification_field = NumericField(0, 1, value=IDENTIFICATION)
+    _article_field = NumericField(1, 1, value=ARTICLE)
+    _serial_number_field = NumericField(2, 4)
+    _detail_number_field = NumericField(6, 4)
+    _account_number_field = StringField(10, 37)
+    _account_holder_name_field = StringField(47, 35)
+    _description_field = StringField(82, 43)
+    _sequence_code_field = ZeroesField(125, 1)
+    _empty_field = EmptyField(126, 1)
+    _information_sequence_field = BooleanField(
+        127, 1, value=None, true_value="1", false_value="0"
+    )
+
     def __init__(
         self,
         serial_number=None,
@@ -333,34 +639,13 @@ class TransactionDetailRecord(Record):
         description=None,
         information_sequence=None,
     ):
-        super(TransactionDetailRecord, self).__init__()
-
-        self._identification_field = NumericField(
-            0, 1, value=TransactionDetailRecord.IDENTIFICATION
-        )
-        self._article_field = NumericField(1, 1, value=TransactionDetailRecord.ARTICLE)
-        self._serial_number_field = NumericField(2, 4, value=serial_number)
-        self._detail_number_field = NumericField(6, 4, value=detail_number)
-        self._account_number_field = StringField(10, 37, value=account_number)
-        self._account_holder_name_field = StringField(47, 35, value=account_holder_name)
-        self._description_field = StringField(82, 43, value=description)
-        self._sequence_code_field = ZeroesField(125, 1)
-        self._empty_field = EmptyField(126, 1)
-        self._information_sequence_field = BooleanField(
-            127, 1, value=information_sequence, true_value="1", false_value="0"
-        )
-
-        self._fields = (
-            self._identification_field,
-            self._article_field,
-            self._serial_number_field,
-            self._detail_number_field,
-            self._account_number_field,
-            self._account_holder_name_field,
-            self._description_field,
-            self._sequence_code_field,
-            self._empty_field,
-            self._information_sequence_field,
+        super(TransactionDetailRecord, self).__init__(
+            serial_number=serial_number,
+            detail_number=detail_number,
+            account_number=account_number,
+            account_holder_name=account_holder_name,
+            description=description,
+            information_sequence=information_sequence,
         )
 
 
@@ -368,6 +653,23 @@ class InformationRecord(Record):
     IDENTIFICATION = RecordIdentification.INFORMATION
     ARTICLE = RecordArticle.DEFAULT
 
+    _identification_field = NumericField(0, 1, value=IDENTIFICATION)
+    _article_field = NumericField(1, 1, value=ARTICLE)
+    _serial_number_field = NumericField(2, 4)
+    _detail_number_field = NumericField(6, 4)
+    _reference_number_field = StringField(10, 21, tag="61/8")
+    _transaction_code_field = NumericField(31, 8, tag="61/6")
+    _reference_type_field = NumericField(39, 1)
+    _reference_field = StringField(40, 73, tag="86")
+    _empty_field0 = EmptyField(113, 12)
+    _transaction_sequence_field = BooleanField(
+        125, 1, value=None, true_value="1", false_value="0"
+    )
+    _empty_field1 = EmptyField(126, 1)
+    _information_sequence_field = BooleanField(
+        127, 1, value=None, true_value="1", false_value="0"
+    )
+
     def __init__(
         self,
         serial_number=None,
@@ -379,44 +681,15 @@ class InformationRecord(Record):
         transaction_sequence=None,
         information_sequence=None,
     ):
-        super(InformationRecord, self).__init__()
-
-        self._identification_field = NumericField(
-            0, 1, value=InformationRecord.IDENTIFICATION
-        )
-        self._article_field = NumericField(1, 1, value=InformationRecord.ARTICLE)
-        self._serial_number_field = NumericField(2, 4, value=serial_number)
-        self._detail_number_field = NumericField(6, 4, value=detail_number)
-        self._reference_number_field = StringField(
-            10, 21, value=reference_number, tag="61/8"
-        )
-        self._transaction_code_field = NumericField(
-            31, 8, value=transaction_code, tag="61/6"
-        )
-        self._reference_type_field = NumericField(39, 1, value=reference_type)
-        self._reference_field = StringField(40, 73, value=reference, tag="86")
-        self._empty_field0 = EmptyField(113, 12)
-        self._transaction_sequence_field = BooleanField(
-            125, 1, value=transaction_sequence, true_value="1", false_value="0"
-        )
-        self._empty_field1 = EmptyField(126, 1)
-        self._information_sequence_field = BooleanField(
-            127, 1, value=information_sequence, true_value="1", false_value="0"
-        )
-
-        self._fields = (
-            self._identification_field,
-            self._article_field,
-            self._serial_number_field,
-            self._detail_number_field,
-            self._reference_number_field,
-            self._transaction_code_field,
-            self._reference_type_field,
-            self._reference_field,
-            self._empty_field0,
-            self._transaction_sequence_field,
-            self._empty_field1,
-            self._information_sequence_field,
+        super(InformationRecord, self).__init__(
+            serial_number=serial_number,
+            detail_number=detail_number,
+            reference_number=reference_number,
+            transaction_code=transaction_code,
+            reference_type=reference_type,
+            reference=reference,
+            transaction_sequence=transaction_sequence,
+            information_sequence=information_sequence,
         )
 
 
@@ -424,6 +697,20 @@ class InformationPurposeRecord(Record):
     IDENTIFICATION = RecordIdentification.INFORMATION
     ARTICLE = RecordArticle.PURPOSE
 
+    _identification_field = NumericField(0, 1, value=IDENTIFICATION)
+    _article_field = NumericField(1, 1, value=ARTICLE)
+    _serial_number_field = NumericField(2, 4)
+    _detail_number_field = NumericField(6, 4)
+    _bank_reference_number_field = StringField(10, 105)
+    _empty_field0 = EmptyField(115, 10)
+    _information_sequence_field0 = BooleanField(
+        125, 1, value=None, true_value="1", false_value="0"
+    )
+    _empty_field1 = EmptyField(126, 1)
+    _information_sequence_field1 = BooleanField(
+        127, 1, value=None, true_value="1", false_value="0"
+    )
+
     def __init__(
         self,
         serial_number=None,
@@ -432,43 +719,38 @@ class InformationPurposeRecord(Record):
         information_sequence0=None,
         information_sequence1=None,
     ):
-        super(InformationPurposeRecord, self).__init__()
-
-        self._identification_field = NumericField(
-            0, 1, value=InformationPurposeRecord.IDENTIFICATION
-        )
-        self._article_field = NumericField(1, 1, value=InformationPurposeRecord.ARTICLE)
-        self._serial_number_field = NumericField(2, 4, value=serial_number)
-        self._detail_number_field = NumericField(6, 4, value=detail_number)
-        self._bank_reference_number_field = StringField(
-            10, 105, value=bank_reference_number
-        )
-        self._empty_field0 = EmptyField(115, 10)
-        self._information_sequence_field0 = BooleanField(
-            125, 1, value=information_sequence0, true_value="1", false_value="0"
-        )
-        self._empty_field1 = EmptyField(126, 1)
-        self._information_sequence_field1 = BooleanField(
-            127, 1, value=information_sequence1, true_value="1", false_value="0"
-        )
-
-        self._fields = (
-            self._identification_field,
-            self._article_field,
-            self._serial_number_field,
-            self._detail_number_field,
-            self._bank_reference_number_field,
-            self._empty_field0,
-            self._information_sequence_field0,
-            self._empty_field1,
-            self._information_sequence_field1,
+        super(InformationPurposeRecord, self).__init__(
+            serial_number=serial_number,
+            detail_number=detail_number,
+            bank_reference_number=bank_reference_number,
         )
+        # Both continuation flags share the `information_sequence` name
+        for key, value in (
+            ("_information_sequence_field0", information_sequence0),
+            ("_information_sequence_field1", information_sequence1),
+        ):
+            if value is not None:
+                self._values[self._field_keys.index(key)] = value
 
 
 class InformationDetailRecord(Record):
     IDENTIFICATION = RecordIdentification.INFORMATION
     ARTICLE = RecordArticle.DETAIL
 
+    _identification_field = NumericField(
+        0, 1, value=InformationPurposeRecord.IDENTIFICATION
+    )
+    _article_field = NumericField(1, 1, value=InformationPurposeRecord.ARTICLE)
+    _serial_number_field = NumericField(2, 4)
+    _detail_number_field = NumericField(6, 4)
+    _bank_reference_number_field = StringField(10, 90)
+    _empty_field0 = EmptyField(100, 25)
+    _sequence_code_field = ZeroesField(125, 1)
+    _empty_field1 = EmptyField(126, 1)
+    _information_sequence_field = BooleanField(
+        127, 1, value=None, true_value="1", false_value="0"
+    )
+
     def __init__(
         self,
         serial_number=None,
@@ -476,34 +758,11 @@ class InformationDetailRecord(Record):
         bank_reference_number=None,
         information_sequence=None,
     ):
-        super(InformationDetailRecord, self).__init__()
-
-        self._identification_field = NumericField(
-            0, 1, value=InformationPurposeRecord.IDENTIFICATION
-        )
-        self._article_field = NumericField(1, 1, value=InformationPurposeRecord.ARTICLE)
-        self._serial_number_field = NumericField(2, 4, value=serial_number)
-        self._detail_number_field = NumericField(6, 4, value=detail_number)
-        self._bank_reference_number_field = StringField(
-            10, 90, value=bank_reference_number
-        )
-        self._empty_field0 = EmptyField(100, 25)
-        self._sequence_code_field = ZeroesField(125, 1)
-        self._empty_field1 = EmptyField(126, 1)
-        self._information_sequence_field = BooleanField(
-            127, 1, value=information_sequence, true_value="1", false_value="0"
-        )
-
-        self._fields = (
-            self._identification_field,
-            self._article_field,
-            self._serial_number_field,
-            self._detail_number_field,
-            self._bank_reference_number_field,
-            self._empty_field0,
-            self._sequence_code_field,
-            self._empty_field1,
-            self._information_sequence_field,
+        super(InformationDetailRecord, self).__init__(
+            serial_number=serial_number,
+            detail_number=detail_number,
+            bank_reference_number=bank_reference_number,
+            information_sequence=information_sequence,
         )
 
 
@@ -511,6 +770,15 @@ class NewBalanceRecord(Record):
     IDENTIFICATION = RecordIdentification.NEW_BALANCE
     ARTICLE = None
 
+    _identification_field = NumericField(0, 1, value=IDENTIFICATION)
+    _serial_number_field = NumericField(1, 3, tag="28c/1")
+    _account_number_field = StringField(4, 37)
+    _balance_sign_field = NumericField(41, 1, tag="62F/1")
+    _new_balance_field = BalanceField(42, tag="62F/4", sign="balance_sign")
+    _balance_date_field = DateField(57, 6, tag="62F/2")
+    _empty_field = EmptyField(63, 64)
+    _sequence_field = BooleanField(127, 1, value=None, true_value="1", false_value="0")
+
     def __init__(
         self,
         serial_number=None,
@@ -520,30 +788,13 @@ class NewBalanceRecord(Record):
         balance_date=None,
         sequence=None,
     ):
-        super(NewBalanceRecord, self).__init__()
-
-        self._identification_field = NumericField(
-            0, 1, value=NewBalanceRecord.IDENTIFICATION
-        )
-        self._serial_number_field = NumericField(1, 3, value=serial_number, tag="28c/1")
-        self._account_number_field = StringField(4, 37, value=account_number)
-        self._balance_sign_field = NumericField(41, 1, value=balance_sign, tag="62F/1")
-        self._new_balance_field = BalanceField(42, value=new_balance, tag="62F/4")
-        self._balance_date_field = DateField(57, 6, value=balance_date, tag="62F/2")
-        self._empty_field = EmptyField(63, 64)
-        self._sequence_field = BooleanField(
-            127, 1, value=sequence, true_value="1", false_value="0"
-        )
-
-        self._fields = (
-            self._identification_field,
-            self._serial_number_field,
-            self._account_number_field,
-            self._balance_sign_field,
-            self._new_balance_field,
-            self._balance_date_field,
-            self._empty_field,
-            self._sequence_field,
+        super(NewBalanceRecord, self).__init__(
+            serial_number=serial_number,
+            account_number=account_number,
+            balance_sign=balance_sign,
+            new_balance=new_balance,
+            balance_date=balance_date,
+            sequence=sequence,
         )
 
 
@@ -551,6 +802,15 @@ class ExtraMessageRecord(Record):
     IDENTIFICATION = RecordIdentification.EXTRA_MESSAGE
     ARTICLE = None
 
+    _identification_field = NumericField(0, 1, value=IDENTIFICATION)
+    _empty_field0 = EmptyField(1, 1)
+    _serial_number_field = NumericField(2, 4)
+    _detail_number_field = NumericField(6, 4)
+    _empty_field1 = EmptyField(10, 22)
+    _extra_message_field = StringField(32, 80)
+    _empty_field2 = EmptyField(112, 15)
+    _sequence_field = BooleanField(127, 1, value=None, true_value="1", false_value="0")
+
     def __init__(
         self,
         serial_number=None,
@@ -558,30 +818,11 @@ class ExtraMessageRecord(Record):
         extra_message=None,
         has_sequence=None,
     ):
-        super(ExtraMessageRecord, self).__init__()
-
-        self._identification_field = NumericField(
-            0, 1, value=ExtraMessageRecord.IDENTIFICATION
-        )
-        self._empty_field0 = EmptyField(1, 1)
-        self._serial_number_field = NumericField(2, 4, value=serial_number)
-        self._detail_number_field = NumericField(6, 4, value=detail_number)
-        self._empty_field1 = EmptyField(10, 22)
-        self._extra_message_field = StringField(32, 80, value=extra_message)
-        self._empty_field2 = EmptyField(112, 15)
-        self._sequence_field = BooleanField(
-            127, 1, value=has_sequence, true_value="1", false_value="0"
-        )
-
-        self._fields = (
-            self._identification_field,
-            self._empty_field0,
-            self._serial_number_field,
-            self._detail_number_field,
-            self._empty_field1,
-            self._extra_message_field,
-            self._empty_field2,
-            self._sequence_field,
+        super(ExtraMessageRecord, self).__init__(
+            serial_number=serial_number,
+            detail_number=detail_number,
+            extra_message=extra_message,
+            sequence=has_sequence,
         )
 
 
@@ -589,25 +830,18 @@ class FinalRecord(Record):
     IDENTIFICATION = RecordIdentification.FINAL
     ARTICLE = None
 
-    def __init__(self, number_records=None, debit=None, credit=None, has_sequence=None):
-        super(FinalRecord, self).__init__()
-
-        self._identification_field = NumericField(0, 1, FinalRecord.IDENTIFICATION)
-        self._empty_field0 = EmptyField(1, 15)
-        self._number_records_field = NumericField(16, 6, value=number_records)
-        self._debit_field = BalanceField(22, value=debit)
-        self._credit_field = BalanceField(37, value=credit)
-        self._empty_field1 = EmptyField(52, 75)
-        self._sequence_field = BooleanField(
-            127, 1, value=has_sequence, true_value="1", false_value="2"
-        )
+    _identification_field = NumericField(0, 1, IDENTIFICATION)
+    _empty_field0 = EmptyField(1, 15)
+    _number_records_field = NumericField(16, 6)
+    _debit_field = BalanceField(22)
+    _credit_field = BalanceField(37)
+    _empty_field1 = EmptyField(52, 75)
+    _sequence_field = BooleanField(127, 1, value=None, true_value="1", false_value="2")
 
-        self._fields = (
-            self._identification_field,
-            self._empty_field0,
-            self._number_records_field,
-            self._debit_field,
-            self._credit_field,
-            self._empty_field1,
-            self._sequence_field,
+    def __init__(self, number_records=None, debit=None, credit=None, has_sequence=None):
+        super(FinalRecord, self).__init__(
+            number_records=number_records,
+            debit=debit,
+            credit=credit,
+            sequence=has_sequence,
         )
@@ -0,0 +1,81 @@
+from __future__ import unicode_literals
+
+from os import linesep
+
+from pycoda.movement import MOVEMENT_IDENTIFICATIONS, itermovements
+from pycoda.records import (
+    ExtraMessageRecord,
+    FinalRecord,
+    InitialRecord,
+    NewBalanceRecord,
+    OldBalanceRecord,
+)
+
+
+class Statement(object):
+    """Records of a single statement, from its initial record up to its final one"""
+
+    def __init__(self, records=None):
+        self.records = records or []
+
+    def _first(self, record_type):
+        for record in self.records:
+            if isinstance(record, record_type):
+                return record
+        return None
+
+    @property
+    def initial_record(self):
+        return self._first(InitialRecord)
+
+    @property
+    def old_balance_record(self):
+        return self._first(OldBalanceRecord)
+
+    @property
+    def new_balance_record(self):
+        return self._first(NewBalanceRecord)
+
+    @property
+    def final_record(self):
+        return self._first(FinalRecord)
+
+    @property
+    def movement_records(self):
+        """Transaction and information records, in statement order"""
+        return [
+            record
+            for record in self.records
+            if record.IDENTIFICATION in MOVEMENT_IDENTIFICATIONS
+        ]
+
+    @property
+    def movements(self):
+        """Movements assembled from the movement records, see `itermovements`"""
+        return list(itermovements(self.records))
+
+    @property
+    def extra_message_records(self):
+        return [
+            record for record in self.records if isinstance(record, ExtraMessageRecord)
+        ]
+
+    def dumps(self, sep=linesep):
+        return sep.join(record.dumps() for record in self.records)
+
+
+def iterstatements(records):
+    """Generates a Statement as soon as the final record of a statement is read
+
+    `records` can be any iterable, such as a record generator. The generator only
+    holds on to the records of the statement being read, so memory is bounded by
+    the largest statement instead of the whole file.
+    """
+    statement = Statement()
+    for record in records:
+        statement.records.append(record)
+        if isinstance(record, FinalRecord):
+            yield statement
+            statement = Statement()
+    if statement.records:
+        raise ValueError("Last statement has no final record")
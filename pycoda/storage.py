@@ -0,0 +1,249 @@
+"""Archive of CODA files in a SQLite database
+
+Each record type is stored in its own table, with a column per field, next to a
+`statements` table. Records refer to their statement by `statement_id` and keep
+their `position` in it, so that files can be queried with SQL and rebuilt from
+their rows without parsing the original files again. Field values are stored as:
+
+  * NumericField: INTEGER
+  * DateField: TEXT, as an ISO date
+  * BalanceField: INTEGER, in thousandths (the field's implied decimal places)
+  * BooleanField: INTEGER, 0 or 1
+  * StringField: TEXT
+
+Account numbers, dates, bank reference numbers and amounts are indexed.
+"""
+
+from __future__ import unicode_literals
+
+import heapq
+import re
+import sqlite3
+from datetime import date
+
+from pycoda.codafile import RECORD_TYPES, CodaFile
+from pycoda.fields import (
+    BalanceField,
+    BooleanField,
+    DateField,
+    NumericField,
+    _amount,
+    _iso_date,
+    _unsigned_milli_units,
+)
+from pycoda.statement import iterstatements
+
+BATCH_SIZE = 1024
+
+INDEXED = ("account_number", "bank_reference_number")
+
+_STATEMENTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS statements (
+    id INTEGER PRIMARY KEY,
+    account_number TEXT,
+    creation_date TEXT,
+    old_balance_date TEXT,
+    new_balance_date TEXT
+);
+CREATE INDEX IF NOT EXISTS statements_account_number
+    ON statements (account_number);
+CREATE INDEX IF NOT EXISTS statements_creation_date ON statements (creation_date);
+"""
+
+
+def _date(value):
+    return None if value is None else date.fromisoformat(value)
+
+
+def _boolean(value):
+    return None if value is None else bool(value)
+
+
+def _table(record_type):
+    """Table name of a record type, e.g. transaction_record"""
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", record_type.__name__).lower()
+
+
+def _columns(record_type):
+    """Column name, SQL type and field of every field of a record type"""
+    for name, field in record_type._columns:
+        if isinstance(field, (NumericField, BalanceField, BooleanField)):
+            yield name, "INTEGER", field
+        else:
+            yield name, "TEXT", field
+
+
+def _schema(record_type):
+    """Statements creating the table of a record type and its indexes"""
+    table = _table(record_type)
+    columns = list(_columns(record_type))
+    definitions = [
+        '"{name}" {sql_type}'.format(name=name, sql_type=sql_type)
+        for name, sql_type, _ in columns
+    ]
+    yield (
+        "CREATE TABLE IF NOT EXISTS {table} ("
+        "statement_id INTEGER NOT NULL REFERENCES statements (id), "
+        "position INTEGER NOT NULL, {definitions})"
+    ).format(table=table, definitions=", ".join(definitions))
+    indexed = ["statement_id, position"]
+    indexed.extend(
+        '"{name}"'.format(name=name)
+        for name, _, field in columns
+        if name in INDEXED or isinstance(field, (DateField, BalanceField))
+    )
+    for column in indexed:
+        yield (
+            "CREATE INDEX IF NOT EXISTS {table}_{name} ON {table} ({column})"
+        ).format(
+            table=table, name=re.sub(r"\W+", "_", column).strip("_"), column=column
+        )
+
+
+def _dumpers(record_type):
+    """Conversion (or None) of each field value of a record type to SQLite"""
+    dumpers = []
+    for _, _, field in _columns(record_type):
+        if isinstance(field, DateField):
+            dumpers.append(_iso_date)
+        elif isinstance(field, BalanceField):
+            dumpers.append(_unsigned_milli_units)
+        else:
+            dumpers.append(None)
+    return tuple(dumpers)
+
+
+def _loaders(record_type):
+    """Conversion (or None) of each column of a record type back to a field value"""
+    loaders = []
+    for _, _, field in _columns(record_type):
+        if isinstance(field, DateField):
+            loaders.append(_date)
+        elif isinstance(field, BalanceField):
+            loaders.append(_amount)
+        elif isinstance(field, BooleanField):
+            loaders.append(_boolean)
+        else:
+            loaders.append(None)
+    return tuple(loaders)
+
+
+def _insert(record_type):
+    placeholders = ", ".join("?" * (len(record_type._fields) + 2))
+    return "INSERT INTO {table} VALUES ({placeholders})".format(
+        table=_table(record_type), placeholders=placeholders
+    )
+
+
+def create_tables(connection):
+    """Creates the tables and indexes of the archive, unless they exist"""
+    connection.executescript(_STATEMENTS_SCHEMA)
+    for record_type in RECORD_TYPES:
+        for statement in _schema(record_type):
+            connection.execute(statement)
+
+
+def connect(database):
+    """Connection to the archive at a path (or ":memory:"), with its tables"""
+    connection = sqlite3.connect(database)
+    create_tables(connection)
+    return connection
+
+
+def ingest(connection, source, batch_size=BATCH_SIZE):
+    """Stores the statements of a CodaFile or any iterable of records
+
+    The rows of each record type are inserted with `executemany`, in batches of
+    `batch_size`, all in a single transaction: either the whole source is stored,
+    or nothing. Returns the ids of the stored statements.
+    """
+    records = source.records if isinstance(source, CodaFile) else source
+    dumpers = {record_type: _dumpers(record_type) for record_type in RECORD_TYPES}
+    batches = {record_type: [] for record_type in RECORD_TYPES}
+    statement_ids = []
+
+    def flush(record_type):
+        connection.executemany(_insert(record_type), batches[record_type])
+        del batches[record_type][:]
+
+    with connection:
+        for statement in iterstatements(records):
+            statement_id = _insert_statement(connection, statement)
+            statement_ids.append(statement_id)
+            for position, record in enumerate(statement.records):
+                record_type = type(record)
+                row = [statement_id, position]
+                row.extend(
+                    value if dump is None else dump(value)
+                    for dump, value in zip(
+                        dumpers[record_type], record._decoded_values()
+                    )
+                )
+                batch = batches[record_type]
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    flush(record_type)
+        for record_type in RECORD_TYPES:
+            flush(record_type)
+    return statement_ids
+
+
+def _insert_statement(connection, statement):
+    """Id of a new statements row, summarising a statement"""
+    initial = statement.initial_record
+    old_balance = statement.old_balance_record
+    new_balance = statement.new_balance_record
+    cursor = connection.execute(
+        "INSERT INTO statements "
+        "(account_number, creation_date, old_balance_date, new_balance_date) "
+        "VALUES (?, ?, ?, ?)",
+        (
+            old_balance.account_number if old_balance else None,
+            _iso_date(initial.creation_date) if initial else None,
+            _iso_date(old_balance.balance_date) if old_balance else None,
+            _iso_date(new_balance.balance_date) if new_balance else None,
+        ),
+    )
+    return cursor.lastrowid
+
+
+def _iterrows(connection, record_type, statement_ids=None):
+    """Statement id, position and record of each row of a record type, in order"""
+    query = "SELECT * FROM {table}".format(table=_table(record_type))
+    parameters = ()
+    if statement_ids is not None:
+        parameters = tuple(statement_ids)
+        query += " WHERE statement_id IN ({placeholders})".format(
+            placeholders=", ".join("?" * len(parameters))
+        )
+    query += " ORDER BY statement_id, position"
+    loaders = _loaders(record_type)
+    for row in connection.execute(query, parameters):
+        record = record_type._from_values(
+            value if load is None else load(value)
+            for load, value in zip(loaders, row[2:])
+        )
+        yield row[0], row[1], record
+
+
+def iterload(connection, statement_ids=None):
+    """Generates the stored records, statement by statement, in their original order
+
+    With `statement_ids`, only the records of those statements are generated. The
+    rows of all record types are merged as they are read, so memory use does not
+    grow with the size of the archive.
+    """
+    rows = heapq.merge(
+        *(
+            _iterrows(connection, record_type, statement_ids)
+            for record_type in RECORD_TYPES
+        ),
+        key=lambda row: row[:2]
+    )
+    for _, _, record in rows:
+        yield record
+
+
+def load(connection, statement_ids=None):
+    """CodaFile of the stored records, see `iterload`"""
+    return CodaFile(list(iterload(connection, statement_ids)))
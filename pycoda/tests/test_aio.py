@@ -0,0 +1,68 @@
+from __future__ import unicode_literals
+
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from unittest import IsolatedAsyncioTestCase
+
+from pycoda.aio import aiterload, aload
+from pycoda.tests.test_records import (
+    FinalRecordTest,
+    InitialRecordTest,
+    NewBalanceRecordTest,
+    OldBalanceRecordTest,
+    TransactionRecordTest,
+)
+
+
+class AsyncBytesIO(object):
+    """Minimal async byte stream, reading from memory"""
+
+    def __init__(self, content):
+        self.buffer = BytesIO(content)
+        self.reads = 0
+
+    async def read(self, size):
+        self.reads += 1
+        return self.buffer.read(size)
+
+
+class AsyncLoadTest(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.lines = [
+            InitialRecordTest.RAW,
+            OldBalanceRecordTest.RAW,
+            TransactionRecordTest.RAW,
+            NewBalanceRecordTest.RAW,
+            FinalRecordTest.RAW,
+        ]
+        self.content = "\r\n".join(self.lines).encode("latin-1") + b"\r\n"
+
+    async def test_aiterload(self):
+        stream = AsyncBytesIO(self.content)
+        records = [record async for record in aiterload(stream)]
+        assert [record.dumps() for record in records] == self.lines
+
+    async def test_aiterload_small_chunks(self):
+        stream = AsyncBytesIO(self.content)
+        records = [record async for record in aiterload(stream, chunk_size=100)]
+        assert [record.dumps() for record in records] == self.lines
+        assert stream.reads > len(self.lines)
+
+    async def test_aiterload_without_trailing_newline(self):
+        stream = AsyncBytesIO(self.content.rstrip())
+        records = [record async for record in aiterload(stream, chunk_size=200)]
+        assert [record.dumps() for record in records] == self.lines
+
+    async def test_aiterload_executor(self):
+        stream = AsyncBytesIO(self.content)
+        with ThreadPoolExecutor(1) as executor:
+            records = [r async for r in aiterload(stream, executor=executor)]
+        assert len(records) == len(self.lines)
+
+    async def test_aload(self):
+        coda = await aload(AsyncBytesIO(self.content), chunk_size=300)
+        assert coda.dumps("\r\n") == "\r\n".join(self.lines)
+
+    async def test_aload_empty(self):
+        coda = await aload(AsyncBytesIO(b""))
+        assert coda.records == []
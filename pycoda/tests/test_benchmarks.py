@@ -0,0 +1,77 @@
+from __future__ import unicode_literals
+
+import json
+import os
+import runpy
+import tempfile
+from io import StringIO
+from unittest import TestCase, mock
+
+from pycoda.benchmarks import corpus, main, run
+from pycoda.validation import verify
+
+
+class CorpusTest(TestCase):
+    def test_size(self):
+        coda_file = corpus(statements=2, movements=3)
+        assert len(coda_file.records) == 2 * (4 * 3 + 4)
+
+    def test_statements(self):
+        statements = list(corpus(statements=2, movements=3).iterstatements())
+        assert [len(statement.movements) for statement in statements] == [3, 3]
+
+    def test_reconciles(self):
+        assert verify(corpus().records) == []
+
+    def test_seeded(self):
+        assert corpus(movements=2).dumps() == corpus(movements=2).dumps()
+
+    def test_loads_from_dumps(self):
+        string = corpus(statements=1, movements=2).dumps()
+        coda_file = corpus(statements=0)
+        coda_file.loads(string)
+        assert coda_file.dumps() == string
+
+
+class RunTest(TestCase):
+    def setUp(self):
+        self.results = run(statements=1, movements=2, number=1, repeat=1)
+
+    def test_corpus(self):
+        assert self.results["corpus"]["lines"] == 12
+
+    def test_timings(self):
+        timings = self.results["timings"]
+        for name in (
+            "CodaFile.loads",
+            "CodaFile.dumps",
+            "TransactionRecord.loads",
+            "TransactionRecord.dumps",
+            "BalanceField.loads",
+            "DateField.dumps",
+        ):
+            assert timings[name]["best"] <= timings[name]["mean"]
+
+    def test_memory(self):
+        assert self.results["memory"]["CodaFile.loads"] > 0
+
+    def test_json(self):
+        assert json.loads(json.dumps(self.results)) == self.results
+
+
+class MainTest(TestCase):
+    ARGV = ["--statements", "1", "--movements", "1", "--number", "1", "--repeat", "1"]
+
+    def test_output(self):
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        main(self.ARGV + ["--output", path])
+        with open(path) as fp:
+            assert json.load(fp)["corpus"]["statements"] == 1
+
+    def test_module(self):
+        argv = ["pycoda.benchmarks"] + self.ARGV
+        with mock.patch("sys.argv", argv), mock.patch("sys.stdout", StringIO()) as out:
+            runpy.run_module("pycoda.benchmarks", run_name="__main__")
+        assert json.loads(out.getvalue())["corpus"]["movements"] == 1
@@ -1,5 +1,8 @@
 from __future__ import unicode_literals
 
+import os
+import tempfile
+from io import BytesIO, StringIO
 from os import linesep
 from unittest import TestCase
 
@@ -32,6 +35,38 @@ class CodaFileTest(TestCase):
         self.coda.loads(self.string)
         assert self.coda.dumps() == self.string
 
+    def test_loads_bytes(self):
+        self.coda.loads(self.string.encode("cp850"), encoding="cp850")
+        assert self.coda.dumps() == self.string
+
+    def test_loads_lazy(self):
+        coda = CodaFile(lazy=True)
+        coda.loads(self.string)
+        assert coda.records[0]._undecoded
+        assert coda.dumps() == self.string
+
+    def test_dump_text_file(self):
+        fp = StringIO()
+        self.coda.loads(self.string)
+        self.coda.dump(fp)
+        assert fp.getvalue() == self.string
+
+    def test_dump_record_generator(self):
+        fp = BytesIO()
+        self.coda.loads(self.string)
+        records = (record for record in self.coda.records)
+        CodaFile().dump(fp, records=records, sep="\n")
+        assert fp.getvalue() == "\n".join(self.lines).encode("latin-1")
+
+    def test_dump_path(self):
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        self.coda.loads(self.string)
+        self.coda.dump(path)
+        with open(path, "rb") as fp:
+            assert fp.read() == self.string.encode("latin-1")
+
     def test_loads_twice_same_length(self):
         self.coda.loads(self.string)
         self.coda.loads(self.string)
@@ -41,3 +76,119 @@ class CodaFileTest(TestCase):
         self.coda.loads(self.string)
         self.coda.loads(self.string, append=True)
         assert len(self.coda.dumps().splitlines()) == 2 * len(self.lines)
+
+
+class CodaFileIterloadTest(TestCase):
+    def setUp(self):
+        self.lines = (
+            InitialRecordTest.RAW,
+            OldBalanceRecordTest.RAW,
+            TransactionRecordTest.RAW,
+            NewBalanceRecordTest.RAW,
+            FinalRecordTest.RAW,
+        )
+        self.string = "\r\n".join(self.lines) + "\r\n"
+        self.coda = CodaFile()
+
+    def dumps(self, records):
+        return [record.dumps() for record in records]
+
+    def test_iterload_text_file(self):
+        records = self.coda.iterload(StringIO(self.string))
+        assert self.dumps(records) == list(self.lines)
+
+    def test_iterload_binary_file(self):
+        records = self.coda.iterload(BytesIO(self.string.encode("latin-1")))
+        assert self.dumps(records) == list(self.lines)
+
+    def write(self, content):
+        fd, path = tempfile.mkstemp()
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(content)
+        return path
+
+    def test_iterload_path(self):
+        path = self.write(self.string.encode("latin-1"))
+        assert self.dumps(self.coda.iterload(path)) == list(self.lines)
+
+    def test_iterload_mmap(self):
+        path = self.write(self.string.encode("latin-1"))
+        records = self.coda.iterload(path, use_mmap=True)
+        assert self.dumps(records) == list(self.lines)
+
+    def test_iterload_mmap_without_trailing_newline(self):
+        path = self.write("\n".join(self.lines).encode("latin-1"))
+        records = self.coda.iterload(path, use_mmap=True)
+        assert self.dumps(records) == list(self.lines)
+
+    def test_iterload_mmap_lazy(self):
+        path = self.write(self.string.encode("latin-1"))
+        records = list(CodaFile(lazy=True).iterload(path, use_mmap=True))
+        assert self.dumps(records) == list(self.lines)
+        assert records[1].old_balance is not None
+
+    def test_iterload_mmap_non_canonical_line(self):
+        # Serial number padded with spaces instead of zeroes
+        line = TransactionRecordTest.RAW[:2] + "  12" + TransactionRecordTest.RAW[6:]
+        path = self.write(line.encode("latin-1"))
+        (record,) = CodaFile(lazy=True).iterload(path, use_mmap=True)
+        assert record.dumps() == line
+        (record,) = self.coda.iterload(path, use_mmap=True)
+        assert record.serial_number == 12
+        assert record.dumps() == line.replace("  12", "0012", 1)
+
+    def test_iterload_mmap_invalid_line(self):
+        for invalid in ("1" + "X" * 127, "X" * 128):
+            path = self.write("\n".join((self.lines[0], invalid)).encode("latin-1"))
+            for lazy in (False, True):
+                with self.assertRaises(ValueError) as context:
+                    list(CodaFile(lazy=lazy).iterload(path, use_mmap=True))
+                assert "memory at" not in str(context.exception)
+
+    def test_iterload_mmap_empty_file(self):
+        path = self.write(b"")
+        assert list(self.coda.iterload(path, use_mmap=True)) == []
+
+    def test_iterload_mmap_close_early(self):
+        path = self.write(self.string.encode("latin-1"))
+        records = self.coda.iterload(path, use_mmap=True)
+        assert next(records).dumps() == InitialRecordTest.RAW
+        records.close()
+
+    def test_iterload_does_not_keep_records(self):
+        list(self.coda.iterload(StringIO(self.string)))
+        assert self.coda.records == []
+
+    def test_iterload_is_lazy(self):
+        records = self.coda.iterload(StringIO(self.string + "invalid"))
+        assert next(records).dumps() == InitialRecordTest.RAW
+
+
+class CodaFileInternTest(TestCase):
+    def setUp(self):
+        self.string = "\n".join((OldBalanceRecordTest.RAW, NewBalanceRecordTest.RAW))
+        self.string = self.string.encode("latin-1")
+
+    def test_loads(self):
+        coda = CodaFile(intern=True)
+        coda.loads(self.string)
+        old_balance, new_balance = coda.records
+        assert old_balance.account_number is new_balance.account_number
+        assert old_balance.account_number in coda.interned
+
+    def test_loads_without(self):
+        coda = CodaFile()
+        coda.loads(self.string)
+        old_balance, new_balance = coda.records
+        assert old_balance.account_number is not new_balance.account_number
+        assert coda.interned is None
+
+    def test_shared_table(self):
+        interned = {}
+        first, second = CodaFile(intern=interned), CodaFile(intern=interned)
+        first.loads(self.string)
+        second.loads(self.string)
+        assert first.records[0].account_holder_name is (
+            second.records[0].account_holder_name
+        )
@@ -0,0 +1,193 @@
+from __future__ import unicode_literals
+
+import os
+import tempfile
+from datetime import date
+from io import BytesIO
+from unittest import TestCase
+
+import numpy as np
+
+from pycoda import columnar
+from pycoda.codafile import RECORD_TYPES
+from pycoda.fields import DateField
+from pycoda.records import (
+    ExtraMessageRecord,
+    InformationPurposeRecord,
+    InitialRecord,
+    NewBalanceRecord,
+    OldBalanceRecord,
+    TransactionPurposeRecord,
+    TransactionRecord,
+)
+from pycoda.tests.test_records import (
+    FinalRecordTest,
+    InitialRecordTest,
+    NewBalanceRecordTest,
+    OldBalanceRecordTest,
+    TransactionPurposeRecordTest,
+    TransactionRecordTest,
+)
+from pycoda.tests.test_validation import statement_records
+from pycoda.validation import verify
+
+
+class ColumnarTest(TestCase):
+    def setUp(self):
+        self.lines = (
+            InitialRecordTest.RAW,
+            OldBalanceRecordTest.RAW,
+            TransactionRecordTest.RAW,
+            TransactionPurposeRecordTest.RAW,
+            TransactionRecordTest.RAW,
+            NewBalanceRecordTest.RAW,
+            FinalRecordTest.RAW,
+        )
+        self.string = "\n".join(self.lines) + "\n"
+        self.arrays = columnar.loads(self.string)
+
+    def test_rows_per_record_type(self):
+        assert len(self.arrays[InitialRecord]) == 1
+        assert len(self.arrays[TransactionRecord]) == 2
+        assert len(self.arrays[TransactionPurposeRecord]) == 1
+
+    def test_array_for_every_record_type(self):
+        assert set(self.arrays) == set(RECORD_TYPES)
+
+    def test_empty_array_for_missing_record_type(self):
+        assert len(self.arrays[ExtraMessageRecord]) == 0
+
+    def test_numeric_column(self):
+        transactions = self.arrays[TransactionRecord]
+        assert transactions["transaction_code"].tolist() == [150000, 150000]
+
+    def test_numeric_head(self):
+        initial = self.arrays[InitialRecord]
+        assert initial["account_holder_reference"][0] == 886946917
+
+    def test_balance_column_in_thousandths(self):
+        assert self.arrays[OldBalanceRecord]["old_balance"][0] == 5020346650
+        assert self.arrays[TransactionRecord]["balance"][0] == 10000
+
+    def test_date_column(self):
+        balance_date = self.arrays[NewBalanceRecord]["balance_date"][0]
+        assert balance_date == np.datetime64(date(2016, 8, 18))
+
+    def test_date_column_20th_century(self):
+        field = DateField(0)
+        chars = np.frombuffer(b"280386", dtype=np.uint8).reshape(1, 6)
+        assert columnar._date(chars, field)[0] == np.datetime64("1986-03-28")
+
+    def test_date_column_alternate_format(self):
+        field = DateField(0, 8, date_format="%Y%m%d")
+        chars = np.frombuffer(b"20170405", dtype=np.uint8).reshape(1, 8)
+        assert columnar._date(chars, field)[0] == np.datetime64("2017-04-05")
+
+    def test_date_column_invalid_date(self):
+        chars = np.frombuffer(b"310216", dtype=np.uint8).reshape(1, 6)
+        with self.assertRaises(ValueError):
+            columnar._date(chars, DateField(0))
+
+    def test_boolean_column(self):
+        transactions = self.arrays[TransactionRecord]
+        assert transactions["transaction_sequence"].tolist() == [True, True]
+        assert transactions["information_sequence"].tolist() == [False, False]
+
+    def test_string_column_undecoded(self):
+        assert self.arrays[InitialRecord]["bic"][0] == b"KREDBEBB   "
+
+    def test_empty_fields_left_out(self):
+        assert "empty" not in self.arrays[TransactionRecord].dtype.names
+
+    def test_numbered_fields(self):
+        names = self.arrays[InformationPurposeRecord].dtype.names
+        assert names[-2:] == ("information_sequence0", "information_sequence1")
+
+    def test_matches_record_values(self):
+        record = TransactionRecord()
+        record.loads(TransactionRecordTest.RAW)
+        row = self.arrays[TransactionRecord][0]
+        assert row["serial_number"] == record.serial_number
+        assert (
+            row["bank_statement_serial_number"] == record.bank_statement_serial_number
+        )
+        assert row["booking_date"] == np.datetime64(record.booking_date)
+
+    def test_loads_bytes_crlf_without_trailing_newline(self):
+        arrays = columnar.loads("\r\n".join(self.lines).encode("latin-1"))
+        assert len(arrays[TransactionRecord]) == 2
+
+    def test_loads_empty(self):
+        arrays = columnar.loads(b"")
+        assert all(len(array) == 0 for array in arrays.values())
+
+    def test_loads_short_line_raises(self):
+        with self.assertRaises(ValueError):
+            columnar.loads(self.string[1:])
+
+    def test_loads_misaligned_lines_raises(self):
+        with self.assertRaises(ValueError):
+            columnar.loads(self.lines[0][1:] + "\n" + self.lines[1] + " \n")
+
+    def test_loads_non_digit_numeric_raises(self):
+        with self.assertRaises(ValueError):
+            columnar.loads(FinalRecordTest.RAW[:16] + "X" + FinalRecordTest.RAW[17:])
+
+    def test_loads_unknown_record_type_raises(self):
+        with self.assertRaises(ValueError):
+            columnar.loads("7" + FinalRecordTest.RAW[1:])
+
+    def test_load_file_object(self):
+        arrays = columnar.load(BytesIO(self.string.encode("latin-1")))
+        assert len(arrays[TransactionRecord]) == 2
+
+    def test_load_path(self):
+        fd, path = tempfile.mkstemp()
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(self.string.encode("latin-1"))
+        assert len(columnar.load(path)[TransactionRecord]) == 2
+
+    def test_line_column(self):
+        assert self.arrays[TransactionRecord]["line"].tolist() == [2, 4]
+
+
+class ColumnarVerifyTest(TestCase):
+    def verify(self, records):
+        string = "\n".join(record.dumps() for record in records)
+        discrepancies = columnar.verify(columnar.loads(string))
+        assert discrepancies == verify(records)
+        return discrepancies
+
+    def test_verify_balanced(self):
+        assert self.verify(statement_records()) == []
+
+    def test_verify_new_balance(self):
+        assert len(self.verify(statement_records(new_balance="70.000"))) == 1
+
+    def test_verify_final_debit(self):
+        assert len(self.verify(statement_records(debit="80.000"))) == 1
+
+    def test_verify_number_records(self):
+        records = statement_records()
+        del records[4]
+        assert self.verify(records)[0].name == "number_records"
+
+    def test_verify_statements(self):
+        records = statement_records(debit="1.000") + statement_records()
+        records += statement_records(old_balance="99.000", debit="2.000")
+        discrepancies = self.verify(records)
+        assert [(d.statement, d.name) for d in discrepancies] == [
+            (0, "debit"),
+            (2, "new_balance"),
+            (2, "debit"),
+        ]
+
+    def test_verify_without_new_balance(self):
+        records = statement_records()
+        del records[6]
+        assert self.verify(records)[0].name == "number_records"
+
+    def test_verify_records_after_last_final_record(self):
+        records = statement_records() + statement_records()[:3]
+        assert self.verify(records) == []
@@ -0,0 +1,200 @@
+from __future__ import unicode_literals
+
+import csv
+import json
+import os
+import tempfile
+from datetime import datetime
+from io import StringIO
+from unittest import TestCase
+
+from pycoda.codafile import CodaFile
+from pycoda.export import movements_to_csv, movements_to_jsonl, to_csv, to_jsonl
+from pycoda.records import (
+    FinalRecord,
+    OldBalanceRecord,
+    TransactionPurposeRecord,
+    TransactionRecord,
+)
+from pycoda.tests.test_records import (
+    FinalRecordTest,
+    InitialRecordTest,
+    MilliUnitsTest,
+    NewBalanceRecordTest,
+    OldBalanceRecordTest,
+    TransactionRecordTest,
+)
+
+
+class ExportTest(TestCase):
+    def setUp(self):
+        self.lines = (
+            InitialRecordTest.RAW,
+            OldBalanceRecordTest.RAW,
+            TransactionRecordTest.RAW,
+            NewBalanceRecordTest.RAW,
+            FinalRecordTest.RAW,
+        )
+        self.coda = CodaFile()
+        self.coda.loads("\n".join(self.lines))
+
+    def path(self):
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        return path
+
+
+class CsvTest(ExportTest):
+    def rows(self, *args, **kwargs):
+        fp = StringIO()
+        to_csv(*args, target=fp, **kwargs)
+        return list(csv.DictReader(StringIO(fp.getvalue())))
+
+    def test_columns(self):
+        fp = StringIO()
+        to_csv(self.coda, fp, TransactionRecord)
+        header = fp.getvalue().splitlines()[0]
+        assert header.split(",") == list(self.coda.records[2].field_dict())
+
+    def test_filtered(self):
+        assert len(self.rows(self.coda, record_type=TransactionRecord)) == 1
+
+    def test_values(self):
+        (row,) = self.rows(self.coda, record_type=TransactionRecord)
+        assert row["balance"] == "10.000"
+        assert row["balance_date"] == "2016-08-18"
+        assert row["serial_number"] == "1"
+
+    def test_empty_values(self):
+        record = TransactionRecord(balance_date=datetime(2017, 4, 12, 10))
+        (row,) = self.rows([record], record_type=TransactionRecord)
+        assert row["balance_date"] == "2017-04-12"
+        assert row["balance"] == ""
+
+    def test_milli_units(self):
+        (row,) = self.rows(self.coda, record_type=FinalRecord, milli_units=True)
+        assert row["debit"] == "322000"
+
+    def test_loaded_milli_units(self):
+        coda = CodaFile(milli_units=True)
+        coda.loads("\n".join(self.lines))
+        (row,) = self.rows(coda, record_type=FinalRecord)
+        assert row["debit"] == "322.000"
+
+    def test_iterload(self):
+        iterator = CodaFile().iterload(StringIO("\n".join(self.lines)))
+        (row,) = self.rows(iterator, record_type=OldBalanceRecord)
+        assert row["old_balance"] == "5020346.650"
+
+    def test_path(self):
+        path = self.path()
+        to_csv(self.coda, path, FinalRecord)
+        with open(path, encoding="utf-8", newline="") as fp:
+            assert len(list(csv.reader(fp))) == 2
+
+
+class JsonLinesTest(ExportTest):
+    def objects(self, *args, **kwargs):
+        fp = StringIO()
+        to_jsonl(*args, target=fp, **kwargs)
+        return [json.loads(line) for line in fp.getvalue().splitlines()]
+
+    def test_all_records(self):
+        objects = self.objects(self.coda)
+        assert len(objects) == len(self.lines)
+        assert [set(obj) for obj in objects] == [
+            set(record.field_dict()) for record in self.coda.records
+        ]
+
+    def test_filtered(self):
+        objects = self.objects(
+            self.coda.records, record_types=(OldBalanceRecord, FinalRecord)
+        )
+        assert [obj["identification"] for obj in objects] == [1, 9]
+
+    def test_values(self):
+        (obj,) = self.objects(self.coda, record_types=TransactionRecord)
+        assert obj["balance"] == "10.000"
+        assert obj["booking_date"] == "2016-08-18"
+        assert obj["balance_sign"] == 0
+
+    def test_empty_values(self):
+        (obj,) = self.objects([TransactionRecord()])
+        assert obj["balance"] is None
+        assert obj["balance_date"] is None
+        (obj,) = self.objects([TransactionRecord()], milli_units=True)
+        assert obj["balance"] is None
+
+    def test_milli_units(self):
+        (obj,) = self.objects(self.coda, record_types=FinalRecord, milli_units=True)
+        assert obj["debit"] == 322000
+
+    def test_loaded_milli_units(self):
+        coda = CodaFile(milli_units=True)
+        coda.loads("\n".join(self.lines))
+        (obj,) = self.objects(coda, record_types=FinalRecord, milli_units=True)
+        assert obj["debit"] == 322000
+
+    def test_debit_same_in_all_modes(self):
+        debit = MilliUnitsTest.DEBIT_RAW
+        for milli_units in (False, True):
+            coda = CodaFile(milli_units=milli_units)
+            coda.loads(debit)
+            (obj,) = self.objects(coda)
+            assert obj["balance"] == "10.000"
+            assert obj["balance_sign"] == 1
+            (obj,) = self.objects(coda, milli_units=True)
+            assert obj["balance"] == 10000
+
+    def test_lazy(self):
+        coda = CodaFile(lazy=True)
+        coda.loads("\n".join(self.lines))
+        assert self.objects(coda) == self.objects(self.coda)
+
+    def test_path(self):
+        path = self.path()
+        to_jsonl(self.coda, path)
+        with open(path, encoding="utf-8") as fp:
+            assert len(fp.readlines()) == len(self.lines)
+
+
+class MovementsTest(ExportTest):
+    def records(self):
+        transaction = TransactionRecord(
+            serial_number=2, detail_number=0, reference="First ", transaction_sequence=1
+        )
+        purpose = TransactionPurposeRecord(
+            serial_number=2, detail_number=0, bank_statement="part"
+        )
+        return [transaction, purpose]
+
+    def test_csv(self):
+        fp = StringIO()
+        movements_to_csv(self.coda, fp)
+        (row,) = csv.DictReader(StringIO(fp.getvalue()))
+        assert list(row) == list(self.coda.records[2].field_dict()) + ["communication"]
+        assert row["balance"] == "10.000"
+        assert row["communication"] == "101048573874287"
+
+    def test_joined_communication(self):
+        fp = StringIO()
+        movements_to_jsonl(self.records(), fp)
+        (line,) = fp.getvalue().splitlines()
+        obj = json.loads(line)
+        assert obj["serial_number"] == 2
+        assert obj["communication"] == "First part"
+
+    def test_milli_units(self):
+        fp = StringIO()
+        movements_to_jsonl(self.coda, fp, milli_units=True)
+        assert json.loads(fp.getvalue())["balance"] == 10000
+
+    def test_path(self):
+        path = self.path()
+        movements_to_csv(self.coda, path)
+        with open(path, encoding="utf-8", newline="") as fp:
+            assert len(list(csv.reader(fp))) == 2
+        movements_to_jsonl(self.coda, path)
+        with open(path, encoding="utf-8") as fp:
+            assert len(fp.readlines()) == 1
@@ -1,6 +1,6 @@
 from __future__ import unicode_literals
 
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
 from unittest import TestCase
 
@@ -12,6 +12,7 @@ from pycoda.fields import (
     NumericField,
     StringField,
     ZeroesField,
+    _date,
 )
 
 
@@ -300,6 +301,16 @@ class NumericFieldTest(TestCase):
         field = NumericField(0, 16, value=12357, head="asddfg", tail="zxcvb")
         assert field.dumps() == "asddfg12357zxcvb"
 
+    def test_format_source_head_and_tail(self):
+        field = NumericField(0, 16, head="asddfg", tail="zxcvb")
+        namespace = {"value": 12357}
+        source = field._format_source("value", namespace)
+        assert eval(source, namespace) == "asddfg12357zxcvb"
+
+    def test_group_escapes_head_and_tail(self):
+        field = NumericField(0, 4, head="+", tail=".")
+        assert field._group() == r"\+([\d\s]{2})\."
+
     def test_loads_head_align_pad(self):
         field = NumericField(0, 11, head="0", pad="0", align=">")
         field.loads("00886946917")
@@ -349,6 +360,26 @@ class DateFieldTest(TestCase):
         field.loads("20170405")
         assert field.value == date(2017, 4, 5)
 
+    def test_loads_same_as_strptime(self):
+        for string in ("010100", "311268", "010169", "290200", "311299"):
+            expected = datetime.strptime(string, "%d%m%y").date()
+            assert _date(string) == expected
+            assert _date(string.encode("ascii")) == expected
+
+    def test_loads_invalid_date(self):
+        field = DateField(0)
+        with self.assertRaises(ValueError):
+            field.loads("300217")
+
+    def test_loads_binary_alternate_date_format(self):
+        assert _date(b"20170405", "%Y%m%d") == date(2017, 4, 5)
+
+    def test_loads_shared_cache(self):
+        DateField(0).loads("121110")
+        hits = _date.cache_info().hits
+        DateField(10).loads("121110")
+        assert _date.cache_info().hits == hits + 1
+
 
 class BalanceFieldTest(TestCase):
     def test_loads(self):
@@ -378,6 +409,10 @@ class BalanceFieldTest(TestCase):
         field.loads(field.dumps())
         assert field.value == Decimal("655361.024")
 
+    def test_dumps_milli_units(self):
+        field = BalanceField(0, value=-65536128)
+        assert field.dumps() == "000000065536128"
+
     def test_regex_not_implemented(self):
         field = BalanceField(0)
         with self.assertRaises(NotImplementedError):
@@ -0,0 +1,107 @@
+from __future__ import unicode_literals
+
+from io import BytesIO
+from unittest import TestCase
+
+from pycoda.codafile import CodaFile
+from pycoda.instrumentation import Instrumentation
+from pycoda.records import TransactionRecord
+from pycoda.tests.test_records import (
+    FinalRecordTest,
+    InitialRecordTest,
+    NewBalanceRecordTest,
+    OldBalanceRecordTest,
+    TransactionRecordTest,
+)
+
+
+class InstrumentationTest(TestCase):
+    def setUp(self):
+        self.lines = (
+            InitialRecordTest.RAW,
+            OldBalanceRecordTest.RAW,
+            TransactionRecordTest.RAW,
+            NewBalanceRecordTest.RAW,
+            FinalRecordTest.RAW,
+        )
+        self.string = "\n".join(self.lines)
+        self.measurements = []
+        self.instrumentation = Instrumentation(callback=self.callback)
+        self.coda = CodaFile(instrumentation=self.instrumentation)
+
+    def callback(self, stage, name, seconds):
+        self.measurements.append((stage, name))
+
+    def test_loads(self):
+        self.coda.loads(self.string)
+        assert self.coda.dumps("\n") == self.string
+        assert self.instrumentation.lines == len(self.lines)
+        assert self.instrumentation.records["TransactionRecord"] == 1
+        assert set(self.instrumentation.header_time) == {
+            "InitialRecord",
+            "OldBalanceRecord",
+            "TransactionRecord",
+            "NewBalanceRecord",
+            "FinalRecord",
+        }
+
+    def test_loads_field_types(self):
+        self.coda.loads(self.string)
+        fields = self.instrumentation.fields
+        assert fields["BalanceField"] == 5
+        assert fields["DateField"] == 5
+        assert sum(fields.values()) == sum(
+            len(record._fields) for record in self.coda.records
+        )
+        assert set(self.instrumentation.field_time) == set(fields)
+
+    def test_loads_same_values(self):
+        self.coda.loads(self.string.encode("latin-1"))
+        for record in self.coda.records:
+            expected = type(record)()
+            expected.loads(record.dumps())
+            assert record.field_dict() == expected.field_dict()
+
+    def test_loads_lazy(self):
+        coda = CodaFile(lazy=True, instrumentation=self.instrumentation)
+        coda.loads(self.string)
+        assert self.instrumentation.lines == len(self.lines)
+        assert not self.instrumentation.fields
+
+    def test_loads_milli_units(self):
+        coda = CodaFile(instrumentation=self.instrumentation, milli_units=True)
+        coda.loads(self.string)
+        assert coda.records[2].balance == 10000
+        assert coda.dumps("\n") == self.string
+
+    def test_loads_invalid(self):
+        with self.assertRaises(ValueError):
+            TransactionRecord().loads("invalid", instrumentation=self.instrumentation)
+
+    def test_dumps(self):
+        self.coda.loads(self.string)
+        self.coda.dumps()
+        assert self.instrumentation.dumped["FinalRecord"] == 1
+        assert ("dump", "FinalRecord") in self.measurements
+
+    def test_dump(self):
+        self.coda.loads(self.string)
+        self.coda.dump(BytesIO())
+        assert sum(self.instrumentation.dumped.values()) == len(self.lines)
+
+    def test_callback(self):
+        self.coda.loads(self.string)
+        assert ("header", "InitialRecord") in self.measurements
+        assert ("field", "StringField") in self.measurements
+
+    def test_without_callback(self):
+        instrumentation = Instrumentation()
+        CodaFile(instrumentation=instrumentation).loads(self.string)
+        assert instrumentation.lines == len(self.lines)
+
+    def test_as_dict(self):
+        self.coda.loads(self.string)
+        counters = self.instrumentation.as_dict()
+        assert counters["lines"] == len(self.lines)
+        assert counters["records"]["InitialRecord"] == 1
+        assert counters["dumped"] == {}
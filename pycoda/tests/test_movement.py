@@ -0,0 +1,128 @@
+from __future__ import unicode_literals
+
+from unittest import TestCase
+
+from pycoda.movement import itermovements
+from pycoda.records import (
+    FinalRecord,
+    InformationDetailRecord,
+    InformationPurposeRecord,
+    InformationRecord,
+    NewBalanceRecord,
+    OldBalanceRecord,
+    TransactionDetailRecord,
+    TransactionPurposeRecord,
+    TransactionRecord,
+)
+from pycoda.statement import Statement
+
+
+class MovementTest(TestCase):
+    def setUp(self):
+        self.records = [
+            OldBalanceRecord(),
+            TransactionRecord(
+                serial_number=1,
+                reference="Invoice 2016",
+                transaction_sequence=True,
+                information_sequence=False,
+            ),
+            TransactionPurposeRecord(
+                serial_number=1,
+                bank_statement="/0042",
+                transaction_sequence=True,
+                information_sequence=True,
+            ),
+            TransactionDetailRecord(serial_number=1, description=" and more"),
+            InformationRecord(
+                serial_number=1,
+                reference="Some",
+                transaction_sequence=False,
+                information_sequence=True,
+            ),
+            InformationPurposeRecord(serial_number=1, bank_reference_number=" info"),
+            InformationDetailRecord(
+                serial_number=1, bank_reference_number=None, information_sequence=False
+            ),
+            TransactionRecord(
+                serial_number=2, transaction_sequence=False, information_sequence=False
+            ),
+            NewBalanceRecord(),
+            FinalRecord(),
+        ]
+        self.movements = list(itermovements(self.records))
+
+    def test_movement_per_transaction_record(self):
+        assert len(self.movements) == 2
+
+    def test_transaction_record(self):
+        assert self.movements[0].transaction_record is self.records[1]
+        assert self.movements[0].serial_number == 1
+
+    def test_transaction_purpose_records(self):
+        assert self.movements[0].transaction_purpose_records == [self.records[2]]
+
+    def test_transaction_detail_records(self):
+        assert self.movements[0].transaction_detail_records == [self.records[3]]
+
+    def test_information_records(self):
+        assert self.movements[0].information_records == self.records[4:7]
+
+    def test_communication(self):
+        assert self.movements[0].communication == "Invoice 2016/0042 and more"
+
+    def test_information_communication(self):
+        assert self.movements[0].information_communication == "Some info"
+
+    def test_movement_without_continuation(self):
+        assert self.movements[1].records == [self.records[7]]
+        assert self.movements[1].communication == ""
+
+    def test_movement_closed_by_flags(self):
+        movements = itermovements(self.records[:2] + self.records[7:8] + ["invalid"])
+        assert next(movements).transaction_record is self.records[1]
+        assert next(movements).transaction_record is self.records[7]
+
+    def test_movement_closed_by_next_transaction(self):
+        records = [self.records[3], self.records[7]]
+        records[0] = TransactionRecord(serial_number=3)
+        assert len(list(itermovements(records))) == 2
+
+    def test_movement_closed_by_other_record(self):
+        records = self.records[1:3] + self.records[8:]
+        assert len(list(itermovements(records))) == 1
+
+    def test_movement_at_end_of_records(self):
+        movements = list(itermovements(self.records[1:4]))
+        assert len(movements[0].records) == 3
+
+    def test_serial_number_mismatch_raises(self):
+        records = [self.records[1], TransactionPurposeRecord(serial_number=2)]
+        with self.assertRaises(ValueError):
+            list(itermovements(records))
+
+    def test_detail_number_mismatch_raises(self):
+        transaction = TransactionRecord(serial_number=1, detail_number=0)
+        for record in (
+            TransactionPurposeRecord(serial_number=1, detail_number=7),
+            InformationRecord(serial_number=1, detail_number=9),
+        ):
+            with self.assertRaises(ValueError):
+                list(itermovements([transaction, record]))
+
+    def test_same_detail_number(self):
+        transaction = TransactionRecord(
+            serial_number=1, detail_number=2, transaction_sequence=True
+        )
+        purpose = TransactionPurposeRecord(serial_number=1, detail_number=2)
+        (movement,) = itermovements([transaction, purpose])
+        assert movement.detail_number == 2
+        assert movement.records == [transaction, purpose]
+
+    def test_record_without_transaction_raises(self):
+        with self.assertRaises(ValueError):
+            list(itermovements(self.records[2:4]))
+
+    def test_statement_movements(self):
+        movements = Statement(self.records).movements
+        assert [len(movement.records) for movement in movements] == [6, 1]
@@ -0,0 +1,159 @@
+from __future__ import unicode_literals
+
+import os
+import tempfile
+from decimal import Decimal
+from unittest import TestCase
+
+from pycoda.codafile import RECORD_TYPES, CodaFile
+from pycoda.instrumentation import Instrumentation
+from pycoda.parallel import (
+    _byte_ranges,
+    _parse_path,
+    _parse_range,
+    parse_many,
+    parse_ranges,
+)
+from pycoda.records import OldBalanceRecord, TransactionRecord
+from pycoda.tests.test_records import (
+    FinalRecordTest,
+    InitialRecordTest,
+    NewBalanceRecordTest,
+    OldBalanceRecordTest,
+    TransactionRecordTest,
+)
+
+
+class ParseManyTest(TestCase):
+    def setUp(self):
+        self.string = "\n".join(
+            (
+                InitialRecordTest.RAW,
+                OldBalanceRecordTest.RAW,
+                TransactionRecordTest.RAW,
+                NewBalanceRecordTest.RAW,
+                FinalRecordTest.RAW,
+            )
+        )
+        self.paths = [self.write(self.string) for _ in range(3)]
+        self.invalid_path = self.write("invalid")
+
+    def write(self, content):
+        fd, path = tempfile.mkstemp()
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, "w") as fp:
+            fp.write(content)
+        return path
+
+    def test_parse_path(self):
+        result = _parse_path((self.paths[0], "latin-1"))
+        assert result.coda_file.dumps("\n") == self.string
+        assert result.error is None
+
+    def test_parse_path_error(self):
+        result = _parse_path((self.invalid_path, "latin-1"))
+        assert result.coda_file is None
+        assert isinstance(result.error, ValueError)
+
+    def test_parse_many_ordered(self):
+        paths = self.paths + [self.invalid_path]
+        results = list(parse_many(paths, processes=2))
+        assert [result.path for result in results] == paths
+
+    def test_parse_many_results(self):
+        results = list(parse_many(self.paths, processes=2, chunksize=2))
+        assert all(r.coda_file.dumps("\n") == self.string for r in results)
+
+    def test_parse_many_error_does_not_abort(self):
+        paths = [self.invalid_path] + self.paths
+        results = list(parse_many(paths, processes=2))
+        assert results[0].error is not None
+        assert all(result.error is None for result in results[1:])
+
+    def test_parse_many_unordered(self):
+        paths = self.paths + [self.invalid_path]
+        results = list(parse_many(paths, processes=2, ordered=False))
+        assert sorted(result.path for result in results) == sorted(paths)
+
+
+class ParseRangesTest(TestCase):
+    def setUp(self):
+        transactions = [TransactionRecordTest.RAW] * 20
+        self.lines = [InitialRecordTest.RAW, OldBalanceRecordTest.RAW, *transactions]
+        self.lines.extend((NewBalanceRecordTest.RAW, FinalRecordTest.RAW))
+        self.string = "\r\n".join(self.lines) + "\r\n"
+        fd, self.path = tempfile.mkstemp()
+        self.addCleanup(os.remove, self.path)
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(self.string.encode("latin-1"))
+
+    def test_byte_ranges_cover_file(self):
+        ranges = _byte_ranges(self.path, 4)
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == len(self.string)
+        assert all(end == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+
+    def test_byte_ranges_at_line_boundaries(self):
+        for start, _ in _byte_ranges(self.path, 7):
+            assert start % 130 == 0
+
+    def test_byte_ranges_more_than_lines(self):
+        assert len(_byte_ranges(self.path, 100)) == len(self.lines)
+
+    def test_parse_range(self):
+        states = _parse_range((self.path, 130, 390, "latin-1", False, False))
+        records = [RECORD_TYPES[index]._from_state(state) for index, state in states]
+        assert [type(record) for record in records] == [
+            OldBalanceRecord,
+            TransactionRecord,
+        ]
+        assert [record.dumps() for record in records] == self.lines[1:3]
+
+    def test_parse_ranges_in_order(self):
+        records = parse_ranges(self.path, processes=3)
+        assert [record.dumps() for record in records] == self.lines
+
+    def test_load_parallel(self):
+        coda = CodaFile()
+        coda.load(self.path, processes=3)
+        assert coda.dumps("\r\n") + "\r\n" == self.string
+
+    def test_load_sequential(self):
+        coda = CodaFile()
+        coda.load(self.path)
+        assert coda.dumps("\r\n") + "\r\n" == self.string
+
+    def test_load_parallel_milli_units(self):
+        coda = CodaFile(milli_units=True)
+        coda.load(self.path, processes=2)
+        assert coda.records[1].old_balance == 5020346650
+        assert coda.records[-3].balance == 10000
+
+    def test_load_parallel_lazy(self):
+        coda = CodaFile(lazy=True)
+        coda.load(self.path, processes=2)
+        assert coda.records[2]._undecoded
+        assert coda.records[2].balance == Decimal("10.000")
+        assert coda.dumps("\r\n") + "\r\n" == self.string
+
+    def test_load_parallel_unshared_options(self):
+        for coda in (
+            CodaFile(intern=True),
+            CodaFile(instrumentation=Instrumentation()),
+        ):
+            with self.assertRaises(ValueError):
+                coda.load(self.path, processes=2)
+
+    def test_load_parallel_file_object(self):
+        coda = CodaFile()
+        coda.load(self.path)
+        with open(self.path, "rb") as fp:
+            with self.assertRaises(ValueError):
+                coda.load(fp, processes=2)
+        assert len(coda.records) == len(self.lines)
+
+    def test_load_append(self):
+        coda = CodaFile()
+        coda.load(self.path)
+        coda.load(self.path, append=True, processes=2)
+        assert len(coda.records) == 2 * len(self.lines)
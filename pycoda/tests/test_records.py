@@ -1,8 +1,11 @@
 from __future__ import unicode_literals
 
+import pickle
 from datetime import date
 from unittest import TestCase
 
+from pycoda import factories
+from pycoda.fields import Field, NumericField, StringField
 from pycoda.records import (
     ExtraMessageRecord,
     FinalRecord,
@@ -21,11 +24,7 @@ from pycoda.records import (
 
 class DummyRecordTest(TestCase):
     class DummyRecord(Record):
-        def __init__(self):
-            super(Record, self).__init__()
-
-            self._dummy = None
-            self._fields = (self._dummy,)
+        _dummy = NumericField(0, 1)
 
     def setUp(self):
         self.record = self.DummyRecord()
@@ -35,6 +34,71 @@ class DummyRecordTest(TestCase):
         assert self.record.field_dict() == {}
 
 
+class UpperField(StringField):
+    """Field without inline cast expression, loaded through `_cast` instead"""
+
+    def _cast(self, string):
+        return string.upper()
+
+    def _cast_source(self, value, namespace, binary=False):
+        return Field._cast_source(self, value, namespace, binary=binary)
+
+    def _format_source(self, value, namespace):
+        return Field._format_source(self, value, namespace)
+
+
+class GeneratedLoaderTest(TestCase):
+    class UpperRecord(Record):
+        _number_field = NumericField(0, 2)
+        _upper_field = UpperField(2, 3)
+
+    def setUp(self):
+        self.record = self.UpperRecord()
+
+    def test_loads_inline_cast(self):
+        self.record.loads("42abc")
+        assert self.record.number == 42
+
+    def test_loads_fallback_cast(self):
+        self.record.loads("42abc")
+        assert self.record.upper == "ABC"
+
+    def test_loads_bytes_fallback_cast(self):
+        self.record.loads(b"42abc")
+        assert self.record.upper == "ABC"
+
+    def test_loader_shared_between_instances(self):
+        assert self.record._loader() is self.UpperRecord()._loader()
+
+    def test_dumps_fallback_format(self):
+        self.record.number = 42
+        self.record.upper = "abc"
+        assert self.record.dumps() == "42abc"
+
+    def test_dumps_matches_field_format(self):
+        for factory in (
+            factories.InitialRecordFactory,
+            factories.OldBalanceRecordFactory,
+            factories.TransactionRecordFactory,
+            factories.TransactionPurposeRecordFactory,
+            factories.TransactionDetailRecordFactory,
+            factories.InformationRecordFactory,
+            factories.InformationPurposeRecordFactory,
+            factories.InformationDetailRecordFactory,
+            factories.NewBalanceRecordFactory,
+            factories.ExtraMessageRecordFactory,
+            factories.FinalRecordFactory,
+        ):
+            record = factory()
+            fields = zip(record._fields, record._values)
+            expected = "".join(field._format(value) for field, value in fields)
+            assert record.dumps() == expected
+
+    def test_dumps_missing_date(self):
+        with self.assertRaises(ValueError):
+            InitialRecord().dumps()
+
+
 class InitialRecordTest(TestCase):
     RAW = (
         "0000019091672505        00417969  VIKINGCO NV               KRED"
@@ -97,6 +161,62 @@ class InitialRecordTest(TestCase):
         self.record.related_reference = "qwerty"
         assert self.record.related_reference == "qwerty"
 
+    def test_loads_too_short_raises(self):
+        with self.assertRaises(ValueError):
+            self.record.loads(self.RAW[:-1])
+
+    def test_loads_too_long_raises(self):
+        with self.assertRaises(ValueError):
+            self.record.loads(self.RAW + " ")
+
+    def test_loads_invalid_numeric_raises(self):
+        with self.assertRaises(ValueError):
+            self.record.loads("X" + self.RAW[1:])
+
+    def test_loads_bytes(self):
+        self.record.loads(self.RAW.encode("latin-1"))
+        assert self.record.dumps() == self.RAW
+
+    def test_loads_memoryview(self):
+        buffer = memoryview(("\n" + self.RAW + "\n").encode("latin-1"))
+        self.record.loads(buffer[1:-1])
+        assert self.record._raw is None
+        assert self.record.dumps() == self.RAW
+
+    def test_loads_dumps_source_line(self):
+        self.record.loads(self.RAW)
+        assert self.record.dumps() is self.RAW
+
+    def test_set_field_after_loads_dumps_values(self):
+        self.record.loads(self.RAW)
+        self.record.bank_identification_number = 725
+        assert self.record.dumps() == self.RAW[:11] + "725" + self.RAW[14:]
+
+    def test_loads_bytes_encoding(self):
+        self.record.loads(self.RAW)
+        self.record.addressee = "Caf\u00e9 NV"
+        self.record.loads(self.record.dumps().encode("cp850"), encoding="cp850")
+        assert self.record.addressee.strip() == "Caf\u00e9 NV"
+
+    def test_line_regex_shared_between_instances(self):
+        assert self.record._line_regex() is InitialRecord()._line_regex()
+
+    def test_fields_are_class_descriptors(self):
+        assert "creation_date" not in self.record.__dict__
+        assert InitialRecord.creation_date.index == 2
+
+    def test_field_dict_names_shared_between_instances(self):
+        assert "empty" in InitialRecord._field_indexes
+        assert InitialRecord()._field_indexes is self.record._field_indexes
+
+    def test_layout_shared_between_instances(self):
+        assert InitialRecord()._fields is self.record._fields
+        assert not hasattr(self.record, "__dict__") or not vars(self.record)
+
+    def test_pickle(self):
+        self.record.loads(self.RAW)
+        assert pickle.loads(pickle.dumps(self.record)).dumps() == self.RAW
+
     def test_get_unknown_field_value_raises(self):
         with self.assertRaises(AttributeError):
             x = self.record.some_value  # noqa
@@ -253,6 +373,26 @@ class InformationPurposeRecordTest(TestCase):
         for field, next_field in field_iterator:
             assert field.position + field.length == next_field.position
 
+    def test_information_sequences(self):
+        record = InformationPurposeRecord(
+            information_sequence0=True, information_sequence1=False
+        )
+        assert record.dumps()[125:] == "1 0"
+
+    def test_columns_are_unique(self):
+        names = [name for name, _ in InformationPurposeRecord._columns]
+        assert len(set(names)) == len(InformationPurposeRecord._fields)
+        assert names[-3:] == [
+            "information_sequence0",
+            "empty1",
+            "information_sequence1",
+        ]
+
+    def test_from_decoded_values(self):
+        record = InformationPurposeRecord(information_sequence0=True)
+        copy = InformationPurposeRecord._from_values(record._decoded_values())
+        assert copy.dumps() == record.dumps()
+
 
 class InformationDetailRecordTest(TestCase):
     def setUp(self):
@@ -310,3 +450,166 @@ class FinalRecordTest(TestCase):
     def test_example_loads_dumps_raw_record(self):
         self.record.loads(self.RAW)
         assert self.record.dumps() == self.RAW
+
+
+class BinaryLoadsTest(TestCase):
+    def test_loads_bytes_matches_str(self):
+        for record_type, raw in (
+            (InitialRecord, InitialRecordTest.RAW),
+            (OldBalanceRecord, OldBalanceRecordTest.RAW),
+            (TransactionRecord, TransactionRecordTest.RAW),
+            (TransactionPurposeRecord, TransactionPurposeRecordTest.RAW),
+            (TransactionDetailRecord, TransactionDetailRecordTest.RAW),
+            (InformationRecord, InformationRecordTest.RAW),
+            (NewBalanceRecord, NewBalanceRecordTest.RAW),
+            (FinalRecord, FinalRecordTest.RAW),
+        ):
+            record, binary_record = record_type(), record_type()
+            record.loads(raw)
+            binary_record.loads(raw.encode("latin-1"))
+            assert binary_record.field_dict() == record.field_dict()
+
+
+class LazyLoadsTest(TestCase):
+    def setUp(self):
+        self.record = InitialRecord()
+        self.record.loads(InitialRecordTest.RAW, lazy=True)
+
+    def test_fields_undecoded_until_accessed(self):
+        assert self.record._values[2] is None
+        assert self.record.creation_date == date(2016, 9, 19)
+        assert 2 not in self.record._undecoded
+
+    def test_untouched_dumps_raw_line(self):
+        self.record.creation_date
+        assert self.record.dumps() == InitialRecordTest.RAW
+
+    def test_set_field_dumps_values(self):
+        self.record.bank_identification_number = 725
+        assert self.record.dumps()[11:14] == "725"
+        assert self.record.dumps()[:5] == InitialRecordTest.RAW[:5]
+
+    def test_set_two_fields(self):
+        self.record.bank_identification_number = 725
+        self.record.addressee = "ACME"
+        assert self.record.addressee == "ACME"
+
+    def test_loads_bytes(self):
+        record = TransactionRecord()
+        record.loads(memoryview(TransactionRecordTest.RAW.encode("latin-1")), lazy=True)
+        assert record.dumps() == TransactionRecordTest.RAW
+        assert record.reference == TransactionRecordTest.RAW[62:115]
+
+    def test_field_dict_decodes_all(self):
+        eager = InitialRecord()
+        eager.loads(InitialRecordTest.RAW)
+        assert self.record.field_dict() == eager.field_dict()
+        assert not self.record._undecoded
+
+    def test_eager_loads_after_lazy(self):
+        self.record.loads(InitialRecordTest.RAW)
+        assert not self.record._undecoded
+        assert self.record.dumps() == InitialRecordTest.RAW
+
+    def test_invalid_line(self):
+        with self.assertRaises(ValueError):
+            InitialRecord().loads("invalid", lazy=True)
+
+
+class MilliUnitsTest(TestCase):
+    RAW = TransactionRecordTest.RAW
+    DEBIT_RAW = RAW[:31] + "1" + RAW[32:]
+
+    def setUp(self):
+        self.record = TransactionRecord()
+
+    def test_loads_credit(self):
+        self.record.loads(self.RAW, milli_units=True)
+        assert self.record.balance == 10000
+
+    def test_loads_debit(self):
+        self.record.loads(self.DEBIT_RAW, milli_units=True)
+        assert self.record.balance_sign == 1
+        assert self.record.balance == -10000
+
+    def test_loads_bytes(self):
+        self.record.loads(self.DEBIT_RAW.encode("latin-1"), milli_units=True)
+        assert self.record.balance == -10000
+
+    def test_loads_unsigned(self):
+        record = FinalRecord()
+        record.loads(FinalRecordTest.RAW, milli_units=True)
+        assert record.debit == 322000
+
+    def test_loads_lazy(self):
+        self.record.loads(self.DEBIT_RAW, lazy=True, milli_units=True)
+        assert self.record.balance == -10000
+        assert self.record.dumps() == self.DEBIT_RAW
+
+    def test_dumps_after_set(self):
+        self.record.loads(self.DEBIT_RAW, milli_units=True)
+        self.record.balance = -10000
+        assert self.record.dumps() == self.DEBIT_RAW
+
+    def test_set_sign(self):
+        self.record.loads(self.RAW, milli_units=True)
+        self.record.balance = -self.record.balance
+        assert self.record.balance_sign == 1
+        assert self.record.dumps() == self.DEBIT_RAW
+        self.record.balance = 10000
+        assert self.record.dumps() == self.RAW
+
+    def test_set_sign_lazy(self):
+        self.record.loads(self.RAW, lazy=True, milli_units=True)
+        self.record.balance = -10000
+        assert self.record.balance_sign == 1
+        assert self.record.dumps() == self.DEBIT_RAW
+
+    def test_set_zero_keeps_sign(self):
+        self.record.loads(self.DEBIT_RAW, milli_units=True)
+        self.record.balance = 0
+        assert self.record.balance_sign == 1
+
+    def test_set_unsigned(self):
+        record = FinalRecord()
+        record.loads(FinalRecordTest.RAW, milli_units=True)
+        record.debit = -322000
+        assert record.dumps() == FinalRecordTest.RAW
+
+    def test_loaders_per_mode(self):
+        assert self.record._loader(milli_units=True) is not self.record._loader()
+
+
+class InternedTest(TestCase):
+    RAW = OldBalanceRecordTest.RAW.encode("latin-1")
+
+    def setUp(self):
+        self.interned = {}
+        self.first = OldBalanceRecord()
+        self.second = OldBalanceRecord()
+
+    def test_interned_fields(self):
+        assert OldBalanceRecord._interned == (
+            OldBalanceRecord._field_indexes["account_holder_name"],
+            OldBalanceRecord._field_indexes["account_number"],
+        )
+        assert TransactionRecord._interned == ()
+
+    def test_loads_shared(self):
+        self.first.loads(self.RAW, interned=self.interned)
+        self.second.loads(self.RAW, interned=self.interned)
+        assert self.first.account_number is self.second.account_number
+        assert self.first.account_holder_name is self.second.account_holder_name
+        assert self.first.account_description is not (self.second.account_description)
+
+    def test_loads_not_shared(self):
+        self.first.loads(self.RAW)
+        self.second.loads(self.RAW)
+        assert self.first.account_number is not self.second.account_number
+
+    def test_loads_lazy(self):
+        self.first.loads(self.RAW, interned=self.interned)
+        self.second.loads(self.RAW, lazy=True, interned=self.interned)
+        assert self.first.account_number is self.second.account_number
+        assert self.second.field_dict() == self.first.field_dict()
+        assert self.second.dumps() == OldBalanceRecordTest.RAW
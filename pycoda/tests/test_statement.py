@@ -0,0 +1,99 @@
+from __future__ import unicode_literals
+
+from io import StringIO
+from unittest import TestCase
+
+from pycoda.codafile import CodaFile
+from pycoda.records import (
+    ExtraMessageRecord,
+    FinalRecord,
+    InitialRecord,
+    NewBalanceRecord,
+    OldBalanceRecord,
+    TransactionRecord,
+)
+from pycoda.statement import Statement, iterstatements
+from pycoda.tests.test_records import (
+    FinalRecordTest,
+    InformationRecordTest,
+    InitialRecordTest,
+    NewBalanceRecordTest,
+    OldBalanceRecordTest,
+    TransactionRecordTest,
+)
+
+
+class StatementTest(TestCase):
+    def setUp(self):
+        self.lines = [
+            InitialRecordTest.RAW,
+            OldBalanceRecordTest.RAW,
+            TransactionRecordTest.RAW,
+            InformationRecordTest.RAW,
+            NewBalanceRecordTest.RAW,
+            FinalRecordTest.RAW,
+        ]
+        coda = CodaFile()
+        coda.loads("\n".join(self.lines))
+        self.statement = Statement(coda.records)
+
+    def test_initial_record(self):
+        assert isinstance(self.statement.initial_record, InitialRecord)
+
+    def test_old_balance_record(self):
+        assert isinstance(self.statement.old_balance_record, OldBalanceRecord)
+
+    def test_new_balance_record(self):
+        assert isinstance(self.statement.new_balance_record, NewBalanceRecord)
+
+    def test_final_record(self):
+        assert isinstance(self.statement.final_record, FinalRecord)
+
+    def test_movement_records(self):
+        movements = self.statement.movement_records
+        assert [record.dumps() for record in movements] == self.lines[2:4]
+
+    def test_extra_message_records(self):
+        assert self.statement.extra_message_records == []
+        self.statement.records.insert(5, ExtraMessageRecord())
+        assert len(self.statement.extra_message_records) == 1
+
+    def test_missing_record(self):
+        assert Statement().final_record is None
+
+    def test_dumps(self):
+        assert self.statement.dumps("\n") == "\n".join(self.lines)
+
+
+class IterStatementsTest(TestCase):
+    def setUp(self):
+        self.lines = [
+            InitialRecordTest.RAW,
+            OldBalanceRecordTest.RAW,
+            TransactionRecordTest.RAW,
+            NewBalanceRecordTest.RAW,
+            FinalRecordTest.RAW,
+        ]
+        self.string = "\n".join(self.lines * 3)
+        self.coda = CodaFile()
+
+    def test_iterstatements(self):
+        statements = list(self.coda.iterstatements(StringIO(self.string)))
+        assert [s.dumps("\n") for s in statements] == ["\n".join(self.lines)] * 3
+
+    def test_iterstatements_loaded_records(self):
+        self.coda.loads(self.string)
+        assert len(list(self.coda.iterstatements())) == 3
+
+    def test_iterstatements_yields_before_end_of_file(self):
+        statements = self.coda.iterstatements(StringIO(self.string + "\ninvalid"))
+        assert isinstance(next(statements).final_record, FinalRecord)
+
+    def test_iterstatements_separate_records(self):
+        first, second, _ = self.coda.iterstatements(StringIO(self.string))
+        assert first.records[0] is not second.records[0]
+
+    def test_iterstatements_missing_final_record(self):
+        records = [InitialRecord(), TransactionRecord()]
+        with self.assertRaises(ValueError):
+            list(iterstatements(records))
@@ -0,0 +1,134 @@
+from __future__ import unicode_literals
+
+import os
+import tempfile
+from datetime import date
+from decimal import Decimal
+from unittest import TestCase
+
+from pycoda import storage
+from pycoda.benchmarks import corpus
+from pycoda.codafile import CodaFile
+from pycoda.records import FinalRecord, TransactionRecord
+from pycoda.tests.test_records import (
+    FinalRecordTest,
+    InitialRecordTest,
+    NewBalanceRecordTest,
+    OldBalanceRecordTest,
+    TransactionRecordTest,
+)
+
+
+class StorageTest(TestCase):
+    def setUp(self):
+        self.string = "\n".join(
+            (
+                InitialRecordTest.RAW,
+                OldBalanceRecordTest.RAW,
+                TransactionRecordTest.RAW,
+                NewBalanceRecordTest.RAW,
+                FinalRecordTest.RAW,
+            )
+        )
+        self.coda = CodaFile()
+        self.coda.loads(self.string)
+        self.connection = storage.connect(":memory:")
+        self.addCleanup(self.connection.close)
+
+    def test_load_from_ingest(self):
+        storage.ingest(self.connection, self.coda)
+        assert storage.load(self.connection).dumps("\n") == self.string
+
+    def test_same_values(self):
+        storage.ingest(self.connection, self.coda)
+        records = storage.load(self.connection).records
+        assert [record.field_dict() for record in records] == [
+            record.field_dict() for record in self.coda.records
+        ]
+
+    def test_statements(self):
+        assert storage.ingest(self.connection, self.coda) == [1]
+        row = self.connection.execute("SELECT * FROM statements").fetchone()
+        initial, old_balance, _, new_balance, _ = self.coda.records
+        assert row == (
+            1,
+            old_balance.account_number,
+            initial.creation_date.isoformat(),
+            old_balance.balance_date.isoformat(),
+            new_balance.balance_date.isoformat(),
+        )
+
+    def test_columns(self):
+        storage.ingest(self.connection, self.coda)
+        row = self.connection.execute(
+            "SELECT balance, balance_date, bank_reference_number "
+            "FROM transaction_record"
+        ).fetchone()
+        assert row == (10000, "2016-08-18", self.coda.records[2].bank_reference_number)
+
+    def test_indexes(self):
+        indexes = {
+            row[0]
+            for row in self.connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+        assert {
+            "statements_account_number",
+            "old_balance_record_account_number",
+            "transaction_record_bank_reference_number",
+            "transaction_record_balance",
+            "transaction_record_booking_date",
+            "final_record_debit",
+            "transaction_record_statement_id_position",
+        } <= indexes
+
+    def test_load_statements(self):
+        storage.ingest(self.connection, self.coda)
+        storage.ingest(self.connection, CodaFile().iterload(self.string.splitlines()))
+        assert len(storage.load(self.connection).records) == 10
+        coda = storage.load(self.connection, statement_ids=[2])
+        assert coda.dumps("\n") == self.string
+
+    def test_milli_units(self):
+        coda = CodaFile(milli_units=True)
+        coda.loads(self.string)
+        storage.ingest(self.connection, coda)
+        record = storage.load(self.connection).records[4]
+        assert record.debit == Decimal("322.000")
+
+    def test_missing_values(self):
+        storage.ingest(self.connection, [TransactionRecord(), FinalRecord()])
+        record = storage.load(self.connection).records[0]
+        assert record.balance is None
+        assert record.balance_date is None
+        assert record.transaction_sequence is None
+        row = self.connection.execute("SELECT * FROM statements").fetchone()
+        assert row == (1, None, None, None, None)
+
+    def test_rollback(self):
+        with self.assertRaises(ValueError):
+            storage.ingest(self.connection, self.coda.records[:-1])
+        assert not self.connection.execute("SELECT * FROM statements").fetchall()
+
+
+class CorpusStorageTest(TestCase):
+    def test_batches(self):
+        coda = corpus(statements=3, movements=5)
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        connection = storage.connect(path)
+        self.addCleanup(connection.close)
+        assert storage.ingest(connection, coda, batch_size=2) == [1, 2, 3]
+        assert storage.load(connection).dumps() == coda.dumps()
+
+    def test_reconnect(self):
+        connection = storage.connect(":memory:")
+        self.addCleanup(connection.close)
+        storage.create_tables(connection)
+        storage.ingest(connection, corpus(statements=1, movements=1))
+        balance_date = connection.execute(
+            "SELECT balance_date FROM transaction_record"
+        ).fetchone()[0]
+        assert date.fromisoformat(balance_date)
@@ -0,0 +1,123 @@
+from __future__ import unicode_literals
+
+from datetime import date
+from decimal import Decimal
+from unittest import TestCase
+
+from pycoda.codafile import CodaFile
+from pycoda.records import (
+    FinalRecord,
+    InformationRecord,
+    InitialRecord,
+    NewBalanceRecord,
+    OldBalanceRecord,
+    TransactionRecord,
+)
+from pycoda.validation import Discrepancy, iterdiscrepancies, verify
+
+DAY = date(2016, 8, 18)
+
+
+def statement_records(old_balance="100.000", new_balance="70.500", debit="40.000"):
+    """Records of a statement: -100 old balance, a detailed debit and a credit"""
+    return [
+        InitialRecord(creation_date=DAY),
+        OldBalanceRecord(
+            balance_sign=1, old_balance=Decimal(old_balance), balance_date=DAY
+        ),
+        TransactionRecord(
+            serial_number=1,
+            balance_sign=1,
+            balance=Decimal("40.000"),
+            balance_date=DAY,
+            booking_date=DAY,
+        ),
+        TransactionRecord(
+            serial_number=1,
+            detail_number=1,
+            balance_sign=1,
+            balance=Decimal("40.000"),
+            balance_date=DAY,
+            booking_date=DAY,
+        ),
+        InformationRecord(serial_number=1),
+        TransactionRecord(
+            serial_number=2,
+            balance_sign=0,
+            balance=Decimal("69.500"),
+            balance_date=DAY,
+            booking_date=DAY,
+        ),
+        NewBalanceRecord(
+            balance_sign=1, new_balance=Decimal(new_balance), balance_date=DAY
+        ),
+        FinalRecord(number_records=6, debit=Decimal(debit), credit=Decimal("69.500")),
+    ]
+
+
+class VerifyTest(TestCase):
+    def test_verify_balanced(self):
+        assert verify(statement_records()) == []
+
+    def test_verify_new_balance(self):
+        records = statement_records(new_balance="70.000")
+        assert verify(records) == [
+            Discrepancy(0, "new_balance", Decimal("-70.000"), Decimal("-70.500"))
+        ]
+
+    def test_verify_final_debit(self):
+        records = statement_records(debit="80.000")
+        assert verify(records) == [
+            Discrepancy(0, "debit", Decimal("80.000"), Decimal("40.000"))
+        ]
+
+    def test_verify_number_records(self):
+        records = statement_records()
+        del records[4]
+        assert verify(records) == [Discrepancy(0, "number_records", 6, 5)]
+
+    def test_verify_statement_index(self):
+        records = statement_records() + statement_records(old_balance="99.000")
+        discrepancies = verify(records)
+        assert [discrepancy.statement for discrepancy in discrepancies] == [1]
+
+    def test_verify_unset_values(self):
+        records = [OldBalanceRecord(), TransactionRecord(), NewBalanceRecord()]
+        records.append(FinalRecord(number_records=3))
+        assert verify(records) == []
+
+    def test_iterdiscrepancies_streaming(self):
+        records = iter(statement_records(new_balance="0.000") + ["not a record"])
+        discrepancies = iterdiscrepancies(records)
+        assert next(discrepancies).name == "new_balance"
+
+    def test_verify_milli_units(self):
+        string = "\n".join(record.dumps() for record in statement_records())
+        coda_file = CodaFile(milli_units=True)
+        coda_file.loads(string)
+        assert coda_file.records[1].old_balance == -100000
+        assert verify(coda_file.records) == []
+
+    def test_verify_milli_units_new_balance(self):
+        records = statement_records(new_balance="70.000")
+        string = "\n".join(record.dumps() for record in records)
+        coda_file = CodaFile(milli_units=True)
+        coda_file.loads(string)
+        assert verify(coda_file.records) == [
+            Discrepancy(0, "new_balance", -70000, -70500)
+        ]
+
+    def test_verify_milli_units_zero_amounts(self):
+        records = statement_records(old_balance="0.000", new_balance="0.000")
+        records[5].balance = Decimal("0.000")
+        string = "\n".join(record.dumps() for record in records)
+        coda_file = CodaFile(milli_units=True)
+        coda_file.loads(string)
+        discrepancies = verify(coda_file.records)
+        assert [discrepancy.name for discrepancy in discrepancies] == [
+            "new_balance",
+            "credit",
+        ]
+        for discrepancy in discrepancies:
+            assert type(discrepancy.expected) is int
+            assert type(discrepancy.actual) is int
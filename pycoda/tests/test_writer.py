@@ -0,0 +1,69 @@
+from __future__ import unicode_literals
+
+from io import BytesIO, StringIO
+from unittest import TestCase
+
+from pycoda.codafile import CodaFile
+from pycoda.tests.test_records import (
+    FinalRecordTest,
+    InitialRecordTest,
+    NewBalanceRecordTest,
+    OldBalanceRecordTest,
+    TransactionRecordTest,
+)
+from pycoda.writer import CodaWriter
+
+
+class WritableFile(object):
+    """File object without io base class, telling its kind through its mode"""
+
+    def __init__(self, mode):
+        self.mode = mode
+        self.chunks = []
+
+    def write(self, chunk):
+        self.chunks.append(chunk)
+
+
+class CodaWriterTest(TestCase):
+    def setUp(self):
+        self.lines = [
+            InitialRecordTest.RAW,
+            OldBalanceRecordTest.RAW,
+            TransactionRecordTest.RAW,
+            NewBalanceRecordTest.RAW,
+            FinalRecordTest.RAW,
+        ]
+        self.coda = CodaFile()
+        self.coda.loads("\n".join(self.lines))
+
+    def test_write_text(self):
+        fp = StringIO()
+        with CodaWriter(fp, sep="\r\n") as writer:
+            writer.writerecords(self.coda.records)
+        assert fp.getvalue() == self.coda.dumps("\r\n")
+
+    def test_write_binary(self):
+        fp = BytesIO()
+        with CodaWriter(fp, sep="\n", encoding="cp850") as writer:
+            writer.writerecords(self.coda.records)
+        assert fp.getvalue() == self.coda.dumps("\n").encode("cp850")
+
+    def test_write_in_batches(self):
+        fp = WritableFile("w")
+        with CodaWriter(fp, sep="\n", batch_size=2) as writer:
+            writer.writerecords(iter(self.coda.records))
+            assert len(fp.chunks) == 2
+        assert len(fp.chunks) == 3
+        assert "".join(fp.chunks) == "\n".join(self.lines)
+
+    def test_binary_mode(self):
+        fp = WritableFile("wb")
+        with CodaWriter(fp) as writer:
+            writer.write(self.coda.records[0])
+        assert fp.chunks == [InitialRecordTest.RAW.encode("latin-1")]
+
+    def test_write_nothing(self):
+        fp = StringIO()
+        CodaWriter(fp).close()
+        assert fp.getvalue() == ""
@@ -0,0 +1,92 @@
+"""Balance reconciliation and trailer verification of CODA statements"""
+
+from __future__ import unicode_literals
+
+from collections import namedtuple
+
+from pycoda.fields import BalanceField
+from pycoda.records import (
+    FinalRecord,
+    NewBalanceRecord,
+    OldBalanceRecord,
+    RecordIdentification,
+    TransactionRecord,
+)
+
+# Records counted in the number of records of the final record
+COUNTED_IDENTIFICATIONS = (
+    RecordIdentification.OLD_BALANCE,
+    RecordIdentification.TRANSACTION,
+    RecordIdentification.INFORMATION,
+    RecordIdentification.NEW_BALANCE,
+)
+
+Discrepancy = namedtuple("Discrepancy", ("statement", "name", "expected", "actual"))
+Discrepancy.__doc__ = "Value stated in a statement that doesn't match its content"
+
+
+def signed(amount, sign):
+    """Amount, negated for the debit sign
+
+    Only the magnitude of the amount is used, so integer milli-units, which already
+    carry their sign, are signed the same way as Decimal amounts.
+    """
+    amount = abs(amount or 0)
+    return -amount if sign == BalanceField.DEBIT else amount
+
+
+class _Totals(object):
+    """Running totals of the statement being verified"""
+
+    def __init__(self):
+        # Integers, to keep the totals of integer milli-units integers
+        self.balance = 0
+        self.debit = 0
+        self.credit = 0
+        self.number_records = 0
+
+
+def iterdiscrepancies(records):
+    """Generates the discrepancies of each statement, in a single streaming pass
+
+    For every statement, the old balance plus the signed amounts of its global
+    movements (transaction records with detail number 0; the details of a
+    globalised movement are not counted twice) should equal its new balance, and
+    the debit, credit and number of records of its final record should match
+    its movements. Only running totals are kept, so `records` can be a generator
+    over a file of any size. Amounts can be Decimals or integer milli-units.
+    """
+    statement = 0
+    totals = _Totals()
+    for record in records:
+        if record.IDENTIFICATION in COUNTED_IDENTIFICATIONS:
+            totals.number_records += 1
+        if isinstance(record, OldBalanceRecord):
+            totals.balance = signed(record.old_balance, record.balance_sign)
+        elif isinstance(record, TransactionRecord) and not record.detail_number:
+            amount = abs(record.balance or 0)
+            if record.balance_sign == BalanceField.DEBIT:
+                totals.debit += amount
+            else:
+                totals.credit += amount
+            totals.balance += signed(amount, record.balance_sign)
+        elif isinstance(record, NewBalanceRecord):
+            new_balance = signed(record.new_balance, record.balance_sign)
+            if new_balance != totals.balance:
+                yield Discrepancy(statement, "new_balance", new_balance, totals.balance)
+        elif isinstance(record, FinalRecord):
+            for name, actual in (
+                ("debit", totals.debit),
+                ("credit", totals.credit),
+                ("number_records", totals.number_records),
+            ):
+                expected = getattr(record, name) or 0
+                if expected != actual:
+                    yield Discrepancy(statement, name, expected, actual)
+            statement += 1
+            totals = _Totals()
+
+
+def verify(records):
+    """All discrepancies of the given records, empty when everything adds up"""
+    return list(iterdiscrepancies(records))
@@ -0,0 +1,79 @@
+"""Streaming CODA output, written to file objects in buffered batches"""
+
+from __future__ import unicode_literals
+
+from io import BufferedIOBase, RawIOBase, TextIOBase
+from os import linesep
+
+from pycoda.records import DEFAULT_ENCODING
+
+BATCH_SIZE = 1024
+
+
+def _is_binary(fp):
+    """Whether a file object takes bytes rather than text"""
+    if isinstance(fp, TextIOBase):
+        return False
+    if isinstance(fp, (RawIOBase, BufferedIOBase)):
+        return True
+    return "b" in getattr(fp, "mode", "")
+
+
+class CodaWriter(object):
+    """Writes records to a text or binary file object, `batch_size` at a time
+
+    The written content is the same as `CodaFile.dumps`: records are separated by
+    `sep`, without a trailing separator. Text is encoded with `encoding` for
+    binary file objects. Only the current batch is held in memory, so records can
+    come from any iterator. Call `close` (or use the writer as a context manager)
+    to write the last batch; the file object itself is left open. An
+    `Instrumentation` times the dumping of the records.
+    """
+
+    def __init__(
+        self,
+        fp,
+        sep=linesep,
+        encoding=DEFAULT_ENCODING,
+        batch_size=BATCH_SIZE,
+        instrumentation=None,
+    ):
+        self.fp = fp
+        self.sep = sep
+        self.encoding = encoding
+        self.batch_size = batch_size
+        self.instrumentation = instrumentation
+        self.binary = _is_binary(fp)
+        self._batch = []
+        self._started = False
+
+    def write(self, record):
+        self._batch.append(record.dumps(instrumentation=self.instrumentation))
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def writerecords(self, records):
+        for record in records:
+            self.write(record)
+
+    def flush(self):
+        """Write the current batch to the file object"""
+        if not self._batch:
+            return
+        chunk = self.sep.join(self._batch)
+        if self._started:
+            chunk = self.sep + chunk
+        self._batch = []
+        self._started = True
+        if self.binary:
+            chunk = chunk.encode(self.encoding)
+        self.fp.write(chunk)
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
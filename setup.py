@@ -9,6 +9,7 @@ from setuptools.command.install import install
 import pycoda
 
 install_requires = ("factory-boy",)
+extras_require = {"numpy": ("numpy>=1.26",)}
 
 
 class VerifyVersionCommand(install):
@@ -40,10 +41,11 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/mhemeryck/pycoda",
     install_requires=install_requires,
+    extras_require=extras_require,
     author="Martijn Hemeryck",
     author_email="martijn.hemeryck@gmail.com",
     license="MIT",
-    packages=["pycoda"],
+    packages=["pycoda", "pycoda.benchmarks"],
     zip_safe=True,
     classifiers=[
         "Development Status :: 5 - Production/Stable",